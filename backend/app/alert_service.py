@@ -11,8 +11,7 @@ from app.news_service import NewsService
 from app.watchlist_service import WATCHLIST_TOPICS, WatchlistService
 
 LOGGER = logging.getLogger(__name__)
-MULTISPACE_RE = re.compile(r"\s+")
-NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+NON_ALNUM_RE = re.compile(r"[^a-z0-9]+", re.ASCII)
 
 TOPIC_CANONICAL_MAP: dict[str, str] = {
     topic.casefold(): topic for topic in WATCHLIST_TOPICS
@@ -155,16 +154,14 @@ class AlertService:
 
 def _normalize_text(text: str) -> str:
     lowered = str(text).lower()
-    cleaned = NON_ALNUM_RE.sub(" ", lowered)
-    squashed = MULTISPACE_RE.sub(" ", cleaned).strip()
+    squashed = NON_ALNUM_RE.sub(" ", lowered).strip()
     return f" {squashed} " if squashed else ""
 
 
 
 def _normalize_term(value: str) -> str:
     term = str(value).strip().lower()
-    term = NON_ALNUM_RE.sub(" ", term)
-    return MULTISPACE_RE.sub(" ", term).strip()
+    return NON_ALNUM_RE.sub(" ", term).strip()
 
 
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import io
 import json
 import logging
 import random
@@ -10,6 +11,7 @@ import urllib.error
 import urllib.parse
 import urllib.request
 import xml.etree.ElementTree as ET
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Protocol
@@ -18,6 +20,7 @@ from app.domain.models import WorldEvent
 
 LOGGER = logging.getLogger(__name__)
 USER_AGENT = "WorldMonitor/0.8 (+https://localhost)"
+XML_ACCEPT_HEADERS = {"Accept": "application/rss+xml, application/atom+xml, text/xml"}
 
 
 def utc_now_iso() -> str:
@@ -51,7 +54,7 @@ def stable_external_id(*parts: str) -> str:
     return str(abs(hash(data)))
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectorResult:
     name: str
     events: list[WorldEvent]
@@ -103,11 +106,18 @@ class HttpFetcher:
         raw = self.get_bytes(url, headers={"Accept": "application/json"})
         return json.loads(raw.decode("utf-8", errors="replace"))
 
-    def get_xml(self, url: str) -> ET.Element:
-        raw = self.get_bytes(
-            url, headers={"Accept": "application/rss+xml, application/atom+xml, text/xml"}
-        )
-        return ET.fromstring(raw)
+    def iter_xml_elements(self, url: str, local_names: frozenset[str]) -> Iterator[ET.Element]:
+        """Stream elements whose lowercased local tag is in ``local_names``.
+
+        Each element is cleared once the caller moves past it, so the document is
+        never held in memory as a full tree.
+        """
+        raw = self.get_bytes(url, headers=XML_ACCEPT_HEADERS)
+        for _, node in ET.iterparse(io.BytesIO(raw), events=("end",)):
+            if node.tag.rsplit("}", 1)[-1].lower() not in local_names:
+                continue
+            yield node
+            node.clear()
 
 
 def encode_query(params: dict[str, Any]) -> str:
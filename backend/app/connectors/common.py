@@ -16,14 +16,12 @@ EventCategory = Literal[
     "other",
 ]
 
-NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
-MULTISPACE_RE = re.compile(r"\s+")
+NON_ALNUM_RE = re.compile(r"[^a-z0-9]+", re.ASCII)
 
 
 def normalize_text(value: str) -> str:
     lowered = value.lower()
-    cleaned = NON_ALNUM_RE.sub(" ", lowered)
-    return MULTISPACE_RE.sub(" ", cleaned).strip()
+    return NON_ALNUM_RE.sub(" ", lowered).strip()
 
 
 def text_hash(value: str) -> str:
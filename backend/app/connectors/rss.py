@@ -5,21 +5,29 @@ from __future__ import annotations
 import json
 import time
 import xml.etree.ElementTree as ET
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from app.connectors.base import ConnectorResult, HttpFetcher, parse_datetime
+from app.connectors.base import ConnectorResult, HttpFetcher
 from app.connectors.common import infer_category, infer_severity, normalize_text, text_hash
 from app.domain.models import WorldEvent
 from app.geo_resolver import GeoResolver
 
 GEO_CENTROIDS_PATH = Path(__file__).resolve().parent.parent / "data" / "country_centroids.json"
+ENTRY_TAGS = frozenset({"item", "entry"})
+TITLE_TAGS = frozenset({"title"})
+SUMMARY_TAGS = frozenset({"description", "summary", "content", "encoded"})
+PUBLISHED_TAGS = frozenset({"pubdate", "published", "updated", "date"})
+LINK_FALLBACK_TAGS = frozenset({"guid", "id"})
+LINK_RELS = frozenset({"", "alternate"})
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RssSource:
     name: str
     urls: tuple[str, ...]
@@ -31,14 +39,20 @@ class RssConnector:
 
     def __init__(
         self,
-        config_path: Path,
+        config_path: Path | None = None,
         *,
+        sources: Iterable[dict[str, Any]] | None = None,
         fetcher: HttpFetcher | None = None,
         max_items_per_source: int = 40,
         request_delay_seconds: float = 0.25,
     ) -> None:
         self.fetcher = fetcher or HttpFetcher(timeout_seconds=12.0, retries=2)
-        self.sources = self._load_sources(config_path)
+        if sources is not None:
+            self.sources = _parse_sources(sources, origin="the sources argument")
+        elif config_path is not None:
+            self.sources = _load_sources(config_path, config_path.stat().st_mtime_ns)
+        else:
+            raise ValueError("RssConnector needs either config_path or sources")
         self.max_items_per_source = max(5, max_items_per_source)
         self.request_delay_seconds = max(0.0, request_delay_seconds)
         self.geo_resolver = GeoResolver(centroids_path=GEO_CENTROIDS_PATH)
@@ -71,8 +85,8 @@ class RssConnector:
         source_errors: list[str] = []
         for url in source.urls:
             try:
-                root = self.fetcher.get_xml(url)
-                events = self._parse_feed(root=root, source=source, cutoff=cutoff)
+                entries = self.fetcher.iter_xml_elements(url, ENTRY_TAGS)
+                events = self._parse_feed(entries=entries, source=source, cutoff=cutoff)
                 if events:
                     return events, None
             except Exception as exc:
@@ -80,23 +94,21 @@ class RssConnector:
         return [], "; ".join(source_errors) if source_errors else None
 
     def _parse_feed(
-        self, *, root: ET.Element, source: RssSource, cutoff: datetime
+        self, *, entries: Iterable[ET.Element], source: RssSource, cutoff: datetime
     ) -> list[WorldEvent]:
         parsed: list[WorldEvent] = []
-        for node in root.iter():
-            local = self._local_name(node.tag)
-            if local not in {"item", "entry"}:
-                continue
-            title = self._first_child_text(node, {"title"})
+        for node in entries:
+            title = self._first_child_text(node, TITLE_TAGS)
             url = self._extract_link(node)
             if not title or not url:
                 continue
 
-            summary = self._first_child_text(node, {"description", "summary", "content", "encoded"})
-            published_raw = self._first_child_text(node, {"pubdate", "published", "updated", "date"})
-            occurred_at = self._parse_pub_datetime(published_raw)
-            if self._parse_iso(occurred_at) < cutoff:
+            summary = self._first_child_text(node, SUMMARY_TAGS)
+            published_raw = self._first_child_text(node, PUBLISHED_TAGS)
+            published_dt = self._parse_pub_datetime(published_raw)
+            if published_dt < cutoff:
                 continue
+            occurred_at = published_dt.isoformat().replace("+00:00", "Z")
 
             body = f"{title} {summary} {source.name}"
             category = source.category_hint or infer_category(body, fallback="other")
@@ -142,61 +154,44 @@ class RssConnector:
                 break
         return parsed
 
-    def _load_sources(self, config_path: Path) -> list[RssSource]:
-        payload = json.loads(config_path.read_text(encoding="utf-8"))
-        sources: list[RssSource] = []
-        for raw in payload.get("sources", []):
-            if not isinstance(raw, dict):
-                continue
-            name = str(raw.get("name", "")).strip()
-            if not name:
-                continue
-            urls_raw = raw.get("urls")
-            if isinstance(urls_raw, list):
-                urls = [str(item).strip() for item in urls_raw if str(item).strip()]
-            else:
-                single = str(raw.get("url", "")).strip()
-                urls = [single] if single else []
-            if not urls:
-                continue
-            category_hint = str(raw.get("category", "")).strip().lower() or None
-            sources.append(RssSource(name=name, urls=tuple(urls), category_hint=category_hint))
-        if not sources:
-            raise ValueError(f"No valid RSS sources configured in {config_path}")
-        return sources
-
-    def _parse_pub_datetime(self, value: str) -> str:
+    def _parse_pub_datetime(self, value: str) -> datetime:
+        # RSS pubDate is RFC 822 and Atom dates are ISO 8601; a leading year
+        # picks which parser to try first.
         text = value.strip()
         if not text:
-            return parse_datetime(None)
+            parsed = None
+        elif text[:4].isdigit():
+            parsed = self._parse_iso(text) or self._parse_rfc822(text)
+        else:
+            parsed = self._parse_rfc822(text) or self._parse_iso(text)
+        if parsed is None:
+            parsed = datetime.now(timezone.utc)
+        return parsed.astimezone(timezone.utc).replace(microsecond=0)
+
+    def _parse_rfc822(self, value: str) -> datetime | None:
         try:
-            parsed = parsedate_to_datetime(text)
-            if parsed.tzinfo is None:
-                parsed = parsed.replace(tzinfo=timezone.utc)
-            return parsed.astimezone(timezone.utc).replace(microsecond=0).isoformat().replace(
-                "+00:00", "Z"
-            )
+            parsed = parsedate_to_datetime(value)
         except Exception:
-            return parse_datetime(text)
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed
 
-    def _parse_iso(self, value: str) -> datetime:
+    def _parse_iso(self, value: str) -> datetime | None:
         for candidate in (value, value.replace("Z", "+00:00")):
             try:
                 parsed = datetime.fromisoformat(candidate)
                 if parsed.tzinfo is None:
                     parsed = parsed.replace(tzinfo=timezone.utc)
-                return parsed.astimezone(timezone.utc)
+                return parsed
             except ValueError:
                 continue
-        return datetime.now(timezone.utc)
-
-    def _local_name(self, tag: str) -> str:
-        return tag.rsplit("}", 1)[-1].lower()
+        return None
 
-    def _first_child_text(self, node: ET.Element, local_names: set[str]) -> str:
-        targets = {name.lower() for name in local_names}
-        for child in list(node):
-            if self._local_name(child.tag) not in targets:
+    def _first_child_text(self, node: ET.Element, local_names: frozenset[str]) -> str:
+        # local_names are lowercase tag constants, matched against _local_name().
+        for child in node:
+            if _local_name(child.tag) not in local_names:
                 continue
             text = " ".join(child.itertext()).strip()
             if text:
@@ -204,20 +199,55 @@ class RssConnector:
         return ""
 
     def _extract_link(self, node: ET.Element) -> str:
-        for child in list(node):
-            if self._local_name(child.tag) != "link":
+        for child in node:
+            if _local_name(child.tag) != "link":
                 continue
             href = child.attrib.get("href")
             rel = (child.attrib.get("rel") or "").strip().lower()
-            if href and rel in {"", "alternate"}:
+            if href and rel in LINK_RELS:
                 return href.strip()
             text = " ".join(child.itertext()).strip()
             if text:
                 return text
-        for child in list(node):
-            if self._local_name(child.tag) not in {"guid", "id"}:
+        for child in node:
+            if _local_name(child.tag) not in LINK_FALLBACK_TAGS:
                 continue
             candidate = " ".join(child.itertext()).strip()
             if candidate.startswith("http://") or candidate.startswith("https://"):
                 return candidate
         return ""
+
+
+@lru_cache(maxsize=256)
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1].lower()
+
+
+@lru_cache(maxsize=32)
+def _load_sources(config_path: Path, mtime_ns: int) -> tuple[RssSource, ...]:
+    # Keyed on mtime so an edited sources file is re-read by the next connector.
+    payload = json.loads(config_path.read_text(encoding="utf-8"))
+    return _parse_sources(payload.get("sources", []), origin=str(config_path))
+
+
+def _parse_sources(raw_sources: Iterable[Any], *, origin: str) -> tuple[RssSource, ...]:
+    sources: list[RssSource] = []
+    for raw in raw_sources:
+        if not isinstance(raw, dict):
+            continue
+        name = str(raw.get("name", "")).strip()
+        if not name:
+            continue
+        urls_raw = raw.get("urls")
+        if isinstance(urls_raw, list):
+            urls = [str(item).strip() for item in urls_raw if str(item).strip()]
+        else:
+            single = str(raw.get("url", "")).strip()
+            urls = [single] if single else []
+        if not urls:
+            continue
+        category_hint = str(raw.get("category", "")).strip().lower() or None
+        sources.append(RssSource(name=name, urls=tuple(urls), category_hint=category_hint))
+    if not sources:
+        raise ValueError(f"No valid RSS sources configured in {origin}")
+    return tuple(sources)
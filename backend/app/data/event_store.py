@@ -13,6 +13,7 @@ from typing import Any
 from app.domain.models import AlertEvent, AlertRule, SavedQuery, WorldEvent, utc_now_iso
 
 DEFAULT_DB_NAME = "world_monitor.db"
+DEFAULT_DB_PATH = Path(__file__).resolve().parent / DEFAULT_DB_NAME
 
 
 def _utc_now() -> datetime:
@@ -51,7 +52,7 @@ def _safe_json_loads(value: str | None, fallback: Any) -> Any:
 
 class EventStore:
     def __init__(self, db_path: Path | None = None) -> None:
-        self.db_path = db_path or Path(__file__).resolve().parent / DEFAULT_DB_NAME
+        self.db_path = db_path or DEFAULT_DB_PATH
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._lock = threading.Lock()
         self._init_db()
@@ -7,14 +7,12 @@ import re
 from pathlib import Path
 from typing import Any
 
-NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
-MULTISPACE_RE = re.compile(r"\s+")
+NON_ALNUM_RE = re.compile(r"[^a-z0-9]+", re.ASCII)
 
 
 def _normalize_text(value: str) -> str:
     lowered = value.lower()
-    alnum = NON_ALNUM_RE.sub(" ", lowered)
-    return MULTISPACE_RE.sub(" ", alnum).strip()
+    return NON_ALNUM_RE.sub(" ", lowered).strip()
 
 
 class GeoResolver:
@@ -0,0 +1,69 @@
+"""Shared keep-alive HTTP pool for outbound feed and provider requests."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from urllib.error import HTTPError, URLError
+
+import urllib3
+
+# One pool per upstream host, reused across refreshes so repeat fetches skip the
+# TCP/TLS handshake. Redirects are followed like urlopen does; a single retry covers
+# keep-alive connections the server closed while idle.
+HTTP_POOL = urllib3.PoolManager(
+    num_pools=32,
+    maxsize=4,
+    retries=urllib3.Retry(total=7, connect=1, read=1, redirect=5, status=0, other=0),
+)
+
+ACCEPT_ENCODING = "gzip, deflate"
+
+
+def fetch_bytes(url: str, *, headers: dict[str, str], timeout_seconds: float) -> bytes:
+    """GET ``url`` and return the decoded body.
+
+    Failures are raised as ``urllib.error`` exceptions so callers written against
+    ``urlopen`` keep their existing error handling.
+    """
+    response = _request(url, headers=headers, timeout_seconds=timeout_seconds, preload=True)
+    return response.data
+
+
+def iter_lines(url: str, *, headers: dict[str, str], timeout_seconds: float) -> Iterator[bytes]:
+    """GET ``url`` and yield the decoded body line by line as it arrives.
+
+    Errors map to ``urllib.error`` exceptions like :func:`fetch_bytes`, including
+    ones raised mid-stream. The request is only sent once iteration starts.
+    """
+    response = _request(url, headers=headers, timeout_seconds=timeout_seconds, preload=False)
+    try:
+        yield from response
+    except urllib3.exceptions.HTTPError as exc:
+        raise URLError(exc) from exc
+    finally:
+        # Drain anything a caller left unread so the connection can be reused.
+        response.drain_conn()
+        response.release_conn()
+
+
+def _request(
+    url: str, *, headers: dict[str, str], timeout_seconds: float, preload: bool
+) -> urllib3.BaseHTTPResponse:
+    request_headers = {"Accept-Encoding": ACCEPT_ENCODING, **headers}
+    try:
+        response = HTTP_POOL.request(
+            "GET",
+            url,
+            headers=request_headers,
+            timeout=urllib3.Timeout(connect=timeout_seconds, read=timeout_seconds),
+            preload_content=preload,
+        )
+    except urllib3.exceptions.HTTPError as exc:
+        raise URLError(exc) from exc
+
+    if response.status >= 400:
+        if not preload:
+            response.drain_conn()
+            response.release_conn()
+        raise HTTPError(url, response.status, response.reason or "", response.headers, None)
+    return response
@@ -9,8 +9,9 @@ from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
-from fastapi import FastAPI, Query, Request
+from fastapi import FastAPI, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api import create_ops_router
 from app.alert_service import AlertService
@@ -55,10 +56,12 @@ async def lifespan(_: FastAPI):
     await ingestion_service.start()
     market_service.refresh_async(force=True)
     prediction_market_service.refresh_async(force=True)
-    video_service.refresh_async(force=True)
+    await video_service.start()
     try:
         yield
     finally:
+        await video_service.stop()
+        prediction_market_service.stop()
         await ingestion_service.stop()
         await news_service.stop()
 
@@ -68,6 +71,7 @@ app = FastAPI(
     description="Global intelligence command center backend",
     version="0.6.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -104,13 +108,16 @@ def get_news(refresh: int = Query(default=0, ge=0, le=1)) -> dict:
 
 
 @app.get("/videos")
-def get_videos(refresh: int = Query(default=0, ge=0, le=1)) -> list[dict[str, Any]]:
-    return video_service.get_videos(force_refresh=bool(refresh))
+def get_videos(refresh: int = Query(default=0, ge=0, le=1)) -> Response:
+    return Response(
+        content=video_service.get_videos_json(force_refresh=bool(refresh)),
+        media_type="application/json",
+    )
 
 
 @app.get("/markets")
-def get_markets() -> list[dict[str, Any]]:
-    return market_service.get_markets()
+def get_markets() -> Response:
+    return Response(content=market_service.get_markets_json(), media_type="application/json")
 
 
 @app.get("/markets/history")
@@ -120,13 +127,19 @@ def get_markets_history(
         alias="range",
         pattern="^(24h|7d|1m|6m|1y|5y)$",
     )
-) -> dict:
-    return market_service.get_market_history(range_key=range_key)
+) -> Response:
+    return Response(
+        content=market_service.get_market_history_json(range_key=range_key),
+        media_type="application/json",
+    )
 
 
 @app.get("/prediction-markets")
-def get_prediction_markets(refresh: int = Query(default=0, ge=0, le=1)) -> dict[str, Any]:
-    return prediction_market_service.get_markets(force_refresh=bool(refresh))
+def get_prediction_markets(refresh: int = Query(default=0, ge=0, le=1)) -> Response:
+    return Response(
+        content=prediction_market_service.get_markets_json(force_refresh=bool(refresh)),
+        media_type="application/json",
+    )
 
 
 @app.get("/prediction-markets/status")
@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
+import logging
 import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import date, timedelta
 from typing import Any
 
+import orjson
+
 from app.providers.coingecko_provider import CoinGeckoProvider
 from app.providers.common import ProviderQuote, parse_float, utc_now_iso
 from app.providers.stooq_provider import StooqProvider
+from app.shared_cache import SharedCache
+
+LOGGER = logging.getLogger(__name__)
 
 DEFAULT_HISTORY_RANGE = "1m"
 HISTORY_RANGE_DAYS: dict[str, int] = {
@@ -22,6 +30,13 @@ HISTORY_RANGE_DAYS: dict[str, int] = {
     "5y": 2000,
 }
 MAX_HISTORY_POINTS = 420
+MAX_DOWNSAMPLE_CACHE_ENTRIES = 64
+STOOQ_MAX_PARALLEL = 4
+
+SHARED_SNAPSHOT_KEY = "shared:market:snapshot"
+SHARED_REFRESH_LOCK_KEY = "shared:market:refresh-lock"
+SHARED_HISTORY_KEY = "shared:market:history:{range_key}"
+SHARED_HISTORY_LOCK_KEY = "shared:market:history-lock:{range_key}"
 
 
 @dataclass(frozen=True)
@@ -87,24 +102,45 @@ MARKET_SPECS: tuple[MarketSpec, ...] = (
 
 
 class MarketService:
-    def __init__(self) -> None:
+    def __init__(self, shared_cache: SharedCache | None = None) -> None:
         self.cache_seconds = 60
         self.history_refresh_seconds = 300
         self.request_timeout_seconds = 8.0
+        self.shared_lock_seconds = self.request_timeout_seconds * (len(MARKET_SPECS) + 1)
+        self.shared_retry_seconds = 5.0
+        self.shared_cache = shared_cache or SharedCache()
 
         self.stooq = StooqProvider(timeout_seconds=self.request_timeout_seconds)
-        self.coingecko = CoinGeckoProvider(timeout_seconds=self.request_timeout_seconds)
+        self.coingecko = CoinGeckoProvider(
+            timeout_seconds=self.request_timeout_seconds,
+            shared_cache=self.shared_cache,
+        )
 
+        # Routes call this service from FastAPI's threadpool and the lifespan hook only
+        # uses refresh_async(), so threading primitives never block the event loop.
         self._state_lock = threading.Lock()
-        self._refresh_lock = threading.Lock()
-        self._markets_cache: list[dict[str, Any]] = self._bootstrap_snapshot()
-        self._markets_cached_at = time.time()
-        self._history_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._inflight: Future[None] | None = None
+        self._markets_cache: tuple[dict[str, Any], ...] = self._bootstrap_snapshot()
+        self._markets_json = _dump_json(self._markets_cache)
+        self._markets_cached_at = 0.0
+        self._history_cache: dict[str, tuple[float, bytes]] = {}
+        self._downsample_cache: OrderedDict[
+            tuple[str, str, str, int], list[dict[str, Any]]
+        ] = OrderedDict()
+        self._shared_snapshot_raw: bytes | None = None
+        # Set when another worker holds the refresh lock; reads serve the stale
+        # snapshot without touching Redis until it passes.
+        self._shared_retry_at = 0.0
 
     def get_markets(self) -> list[dict[str, Any]]:
         self._refresh_if_stale()
         with self._state_lock:
-            return [dict(item) for item in self._markets_cache]
+            return list(self._markets_cache)
+
+    def get_markets_json(self) -> bytes:
+        self._refresh_if_stale()
+        with self._state_lock:
+            return self._markets_json
 
     def get_provider_health(self) -> dict[str, dict[str, object]]:
         return {
@@ -112,23 +148,45 @@ class MarketService:
             self.coingecko.name: self.coingecko.health(),
         }
 
-    def get_market_history(self, range_key: str) -> dict[str, Any]:
+    def get_market_history_json(self, range_key: str) -> bytes:
         normalized_range = _normalize_history_range(range_key)
         now = time.time()
 
         with self._state_lock:
             cached = self._history_cache.get(normalized_range)
             if cached and now - cached[0] < self.history_refresh_seconds:
-                return _copy_history_payload(cached[1])
+                return cached[1]
 
-        payload = self._fetch_market_history(normalized_range)
-        with self._state_lock:
-            self._history_cache[normalized_range] = (time.time(), payload)
+        shared_key = SHARED_HISTORY_KEY.format(range_key=normalized_range)
+        shared = _decode_shared(self.shared_cache.get(shared_key))
+        if shared is not None:
+            with self._state_lock:
+                self._history_cache[normalized_range] = shared
+            return shared[1]
+
+        lock_key = SHARED_HISTORY_LOCK_KEY.format(range_key=normalized_range)
+        locked = self.shared_cache.acquire_lock(lock_key, self.shared_lock_seconds)
+        if not locked and cached:
+            return cached[1]
+
+        try:
+            body = _dump_json(self._fetch_market_history(normalized_range))
+            cached_at = time.time()
+            with self._state_lock:
+                self._history_cache[normalized_range] = (cached_at, body)
+            self.shared_cache.set(
+                shared_key,
+                _encode_shared(cached_at, body),
+                self.history_refresh_seconds,
+            )
+        finally:
+            if locked:
+                self.shared_cache.release_lock(lock_key)
 
-        return _copy_history_payload(payload)
+        return body
 
     def refresh_async(self, force: bool = False) -> None:
-        if self._refresh_lock.locked():
+        if self._inflight is not None:
             return
         thread = threading.Thread(
             target=self.refresh,
@@ -143,36 +201,97 @@ class MarketService:
             cache_valid = now - self._markets_cached_at < self.cache_seconds
             if cache_valid and not force:
                 return
-
-        acquired = self._refresh_lock.acquire(blocking=False)
-        if not acquired:
+            inflight = self._inflight
+            owner = inflight is None
+            if owner:
+                inflight = self._inflight = Future()
+
+        if not owner:
+            # Bound the wait by the request timeout rather than the whole refresh
+            # budget; a caller that gives up reads the current (stale) snapshot.
+            done, _ = wait((inflight,), timeout=self.request_timeout_seconds)
+            if not done:
+                LOGGER.warning("Market refresh still running; serving cached data.")
             return
 
         try:
-            now = time.time()
+            self._refresh_markets(force)
+            inflight.set_result(None)
+        except BaseException as exc:
+            inflight.set_exception(exc)
+            raise
+        finally:
             with self._state_lock:
-                cache_valid = now - self._markets_cached_at < self.cache_seconds
-                if cache_valid and not force:
-                    return
+                self._inflight = None
+
+    def _refresh_markets(self, force: bool) -> None:
+        self._sync_shared_snapshot()
+        now = time.time()
+        with self._state_lock:
+            cache_valid = now - self._markets_cached_at < self.cache_seconds
+            if cache_valid and not force:
+                return
 
-            items = self._fetch_live_markets()
+        if not self.shared_cache.acquire_lock(SHARED_REFRESH_LOCK_KEY, self.shared_lock_seconds):
+            with self._state_lock:
+                self._shared_retry_at = time.time() + self.shared_retry_seconds
+            return
+        try:
+            items = tuple(self._fetch_live_markets())
+            body = _dump_json(items)
+            cached_at = time.time()
             with self._state_lock:
                 self._markets_cache = items
-                self._markets_cached_at = time.time()
+                self._markets_json = body
+                self._markets_cached_at = cached_at
+            self.shared_cache.set(
+                SHARED_SNAPSHOT_KEY,
+                _encode_shared(cached_at, body),
+                self.cache_seconds,
+            )
         finally:
-            self._refresh_lock.release()
+            self.shared_cache.release_lock(SHARED_REFRESH_LOCK_KEY)
+
+    def _sync_shared_snapshot(self) -> None:
+        raw = self.shared_cache.get(SHARED_SNAPSHOT_KEY)
+        if raw is None or raw == self._shared_snapshot_raw:
+            return
+        shared = _decode_shared(raw)
+        if shared is None:
+            return
+        cached_at, body = shared
+        try:
+            items = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            return
+        if not isinstance(items, list):
+            return
+
+        with self._state_lock:
+            self._shared_snapshot_raw = raw
+            if cached_at > self._markets_cached_at:
+                self._markets_cache = tuple(items)
+                self._markets_json = body
+                self._markets_cached_at = cached_at
+
+    def _is_stale(self, now: float) -> bool:
+        with self._state_lock:
+            if now < self._shared_retry_at:
+                return False
+            return now - self._markets_cached_at >= self.cache_seconds or not self._markets_cache
 
     def _refresh_if_stale(self) -> None:
         now = time.time()
-        with self._state_lock:
-            stale = now - self._markets_cached_at >= self.cache_seconds
-            empty = not self._markets_cache
-        if stale or empty:
+        if not self._is_stale(now):
+            return
+        # Another worker may already have published a fresher snapshot.
+        self._sync_shared_snapshot()
+        if self._is_stale(now):
             self.refresh_async(force=False)
 
-    def _bootstrap_snapshot(self) -> list[dict[str, Any]]:
+    def _bootstrap_snapshot(self) -> tuple[dict[str, Any], ...]:
         as_of = utc_now_iso()
-        return [
+        return tuple(
             {
                 "symbol": spec.symbol,
                 "name": spec.name,
@@ -183,18 +302,20 @@ class MarketService:
                 "error": "initializing",
             }
             for spec in MARKET_SPECS
-        ]
+        )
 
     def _fetch_live_markets(self) -> list[dict[str, Any]]:
         fetch_iso = utc_now_iso()
-        coingecko_ids = [
-            spec.provider_symbol for spec in MARKET_SPECS if spec.provider == "coingecko"
-        ]
-        coingecko_quotes = self.coingecko.fetch_prices(coingecko_ids)
+
+        # Providers are independent, so a slow Stooq round doesn't hold up CoinGecko.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            stooq_future = executor.submit(self._fetch_stooq_quotes)
+            coingecko_future = executor.submit(self._fetch_coingecko_quotes)
+            quotes = {**stooq_future.result(), **coingecko_future.result()}
 
         items: list[dict[str, Any]] = []
         for spec in MARKET_SPECS:
-            quote = self._fetch_spec_quote(spec, coingecko_quotes)
+            quote = quotes.get(spec.symbol) or self._missing_quote(spec)
             items.append(
                 {
                     "symbol": spec.symbol,
@@ -211,22 +332,29 @@ class MarketService:
 
         return items
 
-    def _fetch_spec_quote(
-        self, spec: MarketSpec, coingecko_quotes: dict[str, ProviderQuote]
-    ) -> ProviderQuote:
-        if spec.provider == "stooq":
-            return self.stooq.fetch_quote(spec.provider_symbol)
-
-        if spec.provider == "coingecko":
-            quote = coingecko_quotes.get(spec.provider_symbol)
-            if quote is None:
-                return ProviderQuote(
-                    price=None,
-                    change_pct=None,
-                    as_of=utc_now_iso(),
-                    error=f"Missing quote for {spec.provider_symbol}",
-                )
-            return quote
+    def _fetch_stooq_quotes(self) -> dict[str, ProviderQuote]:
+        specs = [spec for spec in MARKET_SPECS if spec.provider == "stooq"]
+        with ThreadPoolExecutor(max_workers=STOOQ_MAX_PARALLEL) as executor:
+            quotes = executor.map(lambda spec: self.stooq.fetch_quote(spec.provider_symbol), specs)
+            return {spec.symbol: quote for spec, quote in zip(specs, quotes)}
+
+    def _fetch_coingecko_quotes(self) -> dict[str, ProviderQuote]:
+        specs = [spec for spec in MARKET_SPECS if spec.provider == "coingecko"]
+        coingecko_quotes = self.coingecko.fetch_prices([spec.provider_symbol for spec in specs])
+        return {
+            spec.symbol: coingecko_quotes[spec.provider_symbol]
+            for spec in specs
+            if spec.provider_symbol in coingecko_quotes
+        }
+
+    def _missing_quote(self, spec: MarketSpec) -> ProviderQuote:
+        if spec.provider in {"stooq", "coingecko"}:
+            return ProviderQuote(
+                price=None,
+                change_pct=None,
+                as_of=utc_now_iso(),
+                error=f"Missing quote for {spec.provider_symbol}",
+            )
 
         return ProviderQuote(
             price=None,
@@ -241,15 +369,19 @@ class MarketService:
         start_date = end_date - timedelta(days=days)
 
         series_payload: list[dict[str, Any]] = []
-        for spec in MARKET_SPECS:
-            points = self._fetch_history_points(spec, range_key, start_date, end_date)
-            series_payload.append(
-                {
-                    "symbol": spec.symbol,
-                    "name": spec.name,
-                    "points": points,
-                }
+        with ThreadPoolExecutor(max_workers=STOOQ_MAX_PARALLEL) as executor:
+            all_points = executor.map(
+                lambda spec: self._fetch_history_points(spec, range_key, start_date, end_date),
+                MARKET_SPECS,
             )
+            for spec, points in zip(MARKET_SPECS, all_points):
+                series_payload.append(
+                    {
+                        "symbol": spec.symbol,
+                        "name": spec.name,
+                        "points": points,
+                    }
+                )
 
         return {
             "range": range_key,
@@ -263,50 +395,76 @@ class MarketService:
         if history_symbol is None and spec.provider == "stooq":
             history_symbol = spec.provider_symbol
 
-        rows: list[dict[str, str]] = []
+        closes: list[tuple[str, float]] = []
         if history_symbol:
             try:
-                rows = self.stooq.fetch_daily_rows(
+                closes = self.stooq.fetch_daily_closes(
                     symbol=history_symbol,
                     start_date=start_date,
                     end_date=end_date,
                 )
             except Exception:
-                rows = []
+                closes = []
 
-        if range_key == "24h" and len(rows) > 2:
-            rows = rows[-2:]
+        if range_key == "24h" and len(closes) > 2:
+            closes = closes[-2:]
 
-        points: list[dict[str, Any]] = []
-        for row in rows:
-            close_price = parse_float(row.get("Close"))
-            if close_price is None:
-                continue
+        # Daily rows only change once per session, so reuse the points built for the
+        # same tail instead of rebuilding and downsampling them on every cache miss.
+        memo_key = (spec.symbol, range_key, closes[-1][0], len(closes)) if closes else None
+        if memo_key is not None:
+            with self._state_lock:
+                memoized = self._downsample_cache.get(memo_key)
+                if memoized is not None:
+                    self._downsample_cache.move_to_end(memo_key)
+                    return memoized
 
-            timestamp = (row.get("Date") or "").strip()
-            if not timestamp:
-                continue
+        points: list[dict[str, Any]] = [
+            {
+                "timestamp": timestamp,
+                "price": round(close_price, 4),
+            }
+            for timestamp, close_price in closes
+        ]
+
+        if not points:
+            points = self._fallback_history_points(spec, history_symbol)
+
+        sampled = _downsample_points(points, MAX_HISTORY_POINTS)
+        if memo_key is not None and sampled:
+            with self._state_lock:
+                self._downsample_cache[memo_key] = sampled
+                while len(self._downsample_cache) > MAX_DOWNSAMPLE_CACHE_ENTRIES:
+                    self._downsample_cache.popitem(last=False)
+        return sampled
 
-            points.append(
+
+    def _fallback_history_points(
+        self, spec: MarketSpec, history_symbol: str | None
+    ) -> list[dict[str, Any]]:
+        # Prefer the live card we already hold over another upstream quote request.
+        with self._state_lock:
+            live = next(
+                (item for item in self._markets_cache if item.get("symbol") == spec.symbol),
+                None,
+            )
+        if live is not None and live.get("price") is not None:
+            return [
                 {
-                    "timestamp": timestamp,
-                    "price": round(close_price, 4),
+                    "timestamp": live.get("as_of") or utc_now_iso(),
+                    "price": live["price"],
                 }
-            )
+            ]
 
-        if not points:
-            fallback_symbol = history_symbol or spec.provider_symbol
-            quote = self.stooq.fetch_quote(fallback_symbol)
-            if quote.price is not None:
-                timestamp = quote.as_of or utc_now_iso()
-                points = [
-                    {
-                        "timestamp": timestamp,
-                        "price": round(quote.price, 4),
-                    }
-                ]
-
-        return _downsample_points(points, MAX_HISTORY_POINTS)
+        quote = self.stooq.fetch_quote(history_symbol or spec.provider_symbol)
+        if quote.price is None:
+            return []
+        return [
+            {
+                "timestamp": quote.as_of or utc_now_iso(),
+                "price": round(quote.price, 4),
+            }
+        ]
 
 
 def _normalize_history_range(range_key: str) -> str:
@@ -316,24 +474,24 @@ def _normalize_history_range(range_key: str) -> str:
     return candidate
 
 
-def _copy_history_payload(payload: dict[str, Any]) -> dict[str, Any]:
-    return {
-        "range": payload.get("range", DEFAULT_HISTORY_RANGE),
-        "series": [
-            {
-                "symbol": str(series.get("symbol", "")),
-                "name": str(series.get("name", "")),
-                "points": [
-                    {
-                        "timestamp": str(point.get("timestamp", "")),
-                        "price": float(point.get("price", 0.0)),
-                    }
-                    for point in series.get("points", [])
-                ],
-            }
-            for series in payload.get("series", [])
-        ],
-    }
+def _dump_json(payload: Any) -> bytes:
+    return orjson.dumps(payload)
+
+
+def _encode_shared(cached_at: float, body: bytes) -> bytes:
+    return f"{cached_at:.6f}\n".encode("ascii") + body
+
+
+def _decode_shared(raw: bytes | None) -> tuple[float, bytes] | None:
+    if raw is None:
+        return None
+    header, separator, body = raw.partition(b"\n")
+    if not separator or not body:
+        return None
+    cached_at = parse_float(header.decode("ascii", errors="replace"))
+    if cached_at is None:
+        return None
+    return cached_at, body
 
 
 def _downsample_points(points: list[dict[str, Any]], max_points: int) -> list[dict[str, Any]]:
@@ -8,37 +8,40 @@ tags regions, deduplicates items, and caches results in memory.
 from __future__ import annotations
 
 import asyncio
-import hashlib
+import io
 import json
 import logging
 import os
 import re
+import sys
 import threading
 import time
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from urllib.error import HTTPError, URLError
 
 from app.geo_resolver import GeoResolver
-from urllib.request import Request, urlopen
+from app.http_pool import fetch_bytes
+from app.text_utils import normalize_text, title_fingerprint
 
 LOGGER = logging.getLogger(__name__)
 USER_AGENT = "WorldMonitor/0.2 (+http://localhost)"
 GEO_CENTROIDS_PATH = Path(__file__).resolve().parent / "data" / "country_centroids.json"
 
 HTML_TAG_RE = re.compile(r"<[^>]+>")
-NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
-MULTISPACE_RE = re.compile(r"\s+")
 
-
-def _normalize_text(text: str) -> str:
-    lowered = text.lower()
-    alnum = NON_ALNUM_RE.sub(" ", lowered)
-    return MULTISPACE_RE.sub(" ", alnum).strip()
+# Lowercased local names (namespace stripped) of the feed elements we read.
+ENTRY_TAGS = frozenset({"item", "entry"})
+TITLE_TAGS = frozenset({"title"})
+SUMMARY_TAGS = frozenset({"description", "summary", "content", "encoded"})
+PUBLISHED_TAGS = frozenset({"pubdate", "published", "updated", "date"})
+LINK_FALLBACK_TAGS = frozenset({"guid", "id"})
 
 CATEGORY_RULES: list[tuple[str, tuple[str, ...]]] = [
     (
@@ -224,22 +227,79 @@ COUNTRY_SPECS: list[tuple[str, str, tuple[str, ...]]] = [
     ("New Zealand", "Oceania", ("new zealand", "new zealander")),
 ]
 
+# Category for stories that match no keyword, by (normalized) source-name substring.
+SOURCE_FALLBACK_CATEGORIES: tuple[tuple[str, str], ...] = (
+    ("imf", "economy"),
+    ("world bank", "economy"),
+    ("afdb", "economy"),
+)
+
+NORMALIZED_CATEGORY_RULES: list[tuple[str, tuple[str, ...]]] = [
+    (
+        category,
+        tuple(_kw for _kw in (normalize_text(keyword) for keyword in keywords) if _kw),
+    )
+    for category, keywords in CATEGORY_RULES
+]
+
 NORMALIZED_COUNTRY_SPECS: list[tuple[str, str, tuple[str, ...]]] = [
     (
         country_name,
         region_name,
-        tuple(_kw for _kw in (_normalize_text(keyword) for keyword in keywords) if _kw),
+        tuple(_kw for _kw in (normalize_text(keyword) for keyword in keywords) if _kw),
     )
     for country_name, region_name, keywords in COUNTRY_SPECS
 ]
 
 
+KeywordEntry = tuple[tuple[str, ...], str, int]
+
+
+def _build_keyword_index() -> dict[str, list[KeywordEntry]]:
+    """Map each keyword's first token to its (tokens, kind, priority) entries."""
+    tables = (
+        ("category", [keywords for _, keywords in NORMALIZED_CATEGORY_RULES]),
+        ("country", [keywords for _, _, keywords in NORMALIZED_COUNTRY_SPECS]),
+    )
+    index: dict[str, list[KeywordEntry]] = {}
+    for kind, keyword_groups in tables:
+        for priority, keywords in enumerate(keyword_groups):
+            for keyword in keywords:
+                tokens = tuple(keyword.split(" "))
+                index.setdefault(tokens[0], []).append((tokens, kind, priority))
+    # Longest phrase first, so e.g. "democratic republic of the congo" beats its suffix.
+    for entries in index.values():
+        entries.sort(key=lambda entry: (-len(entry[0]), entry[2]))
+    return index
+
+
+# Category and country keywords share one index, so a single pass over an article's
+# tokens finds every hit for both.
+KEYWORD_INDEX = _build_keyword_index()
+
+
 @dataclass(frozen=True)
 class FeedSource:
     name: str
     urls: tuple[str, ...]
 
 
+@dataclass(frozen=True, slots=True)
+class FeedEntry:
+    """A parsed feed item before cross-source dedup and geo resolution."""
+
+    title: str
+    source: str
+    url: str
+    published_at: str
+    category: str
+    region: str
+    country: str
+    geo_text: str
+    published_epoch: float
+    title_hash: int
+
+
 class NewsService:
     def __init__(self, config_path: Path) -> None:
         self.config_path = config_path
@@ -255,6 +315,7 @@ class NewsService:
             3.0, float(os.getenv("NEWS_FETCH_TIMEOUT_SECONDS", "10"))
         )
         self.request_delay_seconds = max(0.0, float(os.getenv("NEWS_FETCH_DELAY_SECONDS", "0.35")))
+        self.fetch_concurrency = max(1, int(os.getenv("NEWS_FETCH_CONCURRENCY", "6")))
         self.max_items_per_source = max(5, int(os.getenv("NEWS_MAX_ITEMS_PER_SOURCE", "35")))
         self.max_items = max(20, int(os.getenv("NEWS_MAX_ITEMS", "120")))
         self.scheduler_enabled = (
@@ -263,16 +324,24 @@ class NewsService:
         )
 
         self._state_lock = threading.Lock()
-        self._refresh_lock = threading.Lock()
-        self._cache: list[dict[str, Any]] = []
+        self._refreshing = False
+        # Items are never mutated after a refresh, so readers share them directly.
+        self._cache: tuple[dict[str, Any], ...] = ()
         self._last_updated: str | None = None
         self._last_refresh_attempt = 0.0
         self._last_refresh_success = 0.0
         self._scheduler_task: asyncio.Task[None] | None = None
+        self._scheduler_loop_ref: asyncio.AbstractEventLoop | None = None
+        self._refreshed_event = asyncio.Event()
+        # Geo results from the previous refresh, keyed by resolver inputs. Only the
+        # refresh thread touches it, and it is replaced wholesale each run so it never
+        # grows past one refresh worth of items.
+        self._geo_memo: dict[tuple[str | None, str | None, str], dict[str, Any]] = {}
 
     async def start(self) -> None:
         self.refresh_async(force=True, bypass_cooldown=True)
         if self.scheduler_enabled and self._scheduler_task is None:
+            self._scheduler_loop_ref = asyncio.get_running_loop()
             self._scheduler_task = asyncio.create_task(self._scheduler_loop())
 
     async def stop(self) -> None:
@@ -285,6 +354,7 @@ class NewsService:
             pass
         finally:
             self._scheduler_task = None
+            self._scheduler_loop_ref = None
 
     def get_news(self, force_refresh: bool = False) -> dict[str, Any]:
         if force_refresh:
@@ -294,15 +364,33 @@ class NewsService:
 
         with self._state_lock:
             return {
-                "items": [dict(item) for item in self._cache],
+                "items": list(self._cache),
                 "last_updated": self._last_updated,
             }
 
     async def _scheduler_loop(self) -> None:
         while True:
-            await asyncio.sleep(self.refresh_interval_seconds)
+            # Sleep only until the cache actually goes stale; a forced refresh in the
+            # meantime wakes us up to push the deadline back instead of piling on.
+            with self._state_lock:
+                next_due = self._last_refresh_attempt + self.refresh_interval_seconds
+            self._refreshed_event.clear()
+            try:
+                await asyncio.wait_for(
+                    self._refreshed_event.wait(),
+                    timeout=max(1.0, next_due - time.time()),
+                )
+                continue
+            except asyncio.TimeoutError:
+                pass
             await asyncio.to_thread(self.refresh, False, False)
 
+    def _notify_refreshed(self) -> None:
+        loop = self._scheduler_loop_ref
+        if loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(self._refreshed_event.set)
+
     def _refresh_if_stale(self) -> None:
         now = time.time()
         with self._state_lock:
@@ -316,47 +404,41 @@ class NewsService:
             self.refresh_async(force=False)
 
     def refresh_async(self, force: bool = False, bypass_cooldown: bool = False) -> None:
-        if self._refresh_lock.locked():
+        if not self._claim_refresh(force, bypass_cooldown):
             return
-        thread = threading.Thread(
-            target=self.refresh,
-            kwargs={"force": force, "bypass_cooldown": bypass_cooldown},
-            daemon=True,
-        )
+        thread = threading.Thread(target=self._run_refresh, daemon=True)
         thread.start()
 
     def refresh(self, force: bool = False, bypass_cooldown: bool = False) -> None:
+        if self._claim_refresh(force, bypass_cooldown):
+            self._run_refresh()
+
+    def _claim_refresh(self, force: bool, bypass_cooldown: bool) -> bool:
+        """Atomically check the refresh gates and mark a refresh as running."""
         now = time.time()
         with self._state_lock:
+            if self._refreshing:
+                return False
             if force and self._cache and not bypass_cooldown:
                 if now - self._last_refresh_attempt < self.force_refresh_cooldown_seconds:
-                    return
+                    return False
             if not force and self._cache:
                 if now - self._last_refresh_attempt < self.refresh_interval_seconds:
-                    return
-
-        acquired = self._refresh_lock.acquire(blocking=False)
-        if not acquired:
-            return
+                    return False
+            self._refreshing = True
+            self._last_refresh_attempt = now
+            return True
 
+    def _run_refresh(self) -> None:
         try:
-            now = time.time()
-            with self._state_lock:
-                if force and self._cache and not bypass_cooldown:
-                    if now - self._last_refresh_attempt < self.force_refresh_cooldown_seconds:
-                        return
-                if not force and self._cache:
-                    if now - self._last_refresh_attempt < self.refresh_interval_seconds:
-                        return
-                self._last_refresh_attempt = now
-
             items = self._pull_all_sources()
             if items:
                 refreshed_at = _utc_iso(datetime.now(timezone.utc))
                 with self._state_lock:
-                    self._cache = items[: self.max_items]
+                    self._cache = tuple(items[: self.max_items])
                     self._last_updated = refreshed_at
-                    self._last_refresh_success = now
+                    self._last_refresh_success = self._last_refresh_attempt
+                self._notify_refreshed()
             else:
                 with self._state_lock:
                     if self._last_updated is None:
@@ -364,55 +446,67 @@ class NewsService:
         except Exception:
             LOGGER.exception("News refresh failed.")
         finally:
-            self._refresh_lock.release()
+            with self._state_lock:
+                self._refreshing = False
 
     def _pull_all_sources(self) -> list[dict[str, Any]]:
         seen_urls: set[str] = set()
-        seen_title_hashes: set[str] = set()
-        collected: list[dict[str, Any]] = []
-
-        for source in self.sources:
-            source_items = self._fetch_source(source)
-            for item in source_items[: self.max_items_per_source]:
-                url_key = item["url"].strip().lower()
-                title_hash = item["_title_hash"]
-                if url_key in seen_urls or title_hash in seen_title_hashes:
-                    continue
-                seen_urls.add(url_key)
-                seen_title_hashes.add(title_hash)
-                collected.append(item)
-
-            if self.request_delay_seconds > 0:
-                time.sleep(self.request_delay_seconds)
-
-        collected.sort(key=lambda entry: entry["_published_epoch"], reverse=True)
-
+        seen_title_hashes: set[int] = set()
+        collected: list[FeedEntry] = []
+
+        # Sources live on different hosts, so fetch them concurrently; results are
+        # consumed in configured order to keep deduplication deterministic.
+        workers = min(self.fetch_concurrency, len(self.sources))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for source_items in executor.map(self._fetch_source, self.sources):
+                for item in source_items[: self.max_items_per_source]:
+                    url_key = item.url.lower()
+                    title_hash = item.title_hash
+                    if url_key in seen_urls or title_hash in seen_title_hashes:
+                        continue
+                    seen_urls.add(url_key)
+                    seen_title_hashes.add(title_hash)
+                    collected.append(item)
+
+        collected.sort(key=lambda entry: entry.published_epoch, reverse=True)
+
+        previous_geo = self._geo_memo
+        geo_memo: dict[tuple[str | None, str | None, str], dict[str, Any]] = {}
         output: list[dict[str, Any]] = []
         for index, item in enumerate(collected, start=1):
-            geo = self.geo_resolver.resolve(
-                country=item.get("country"),
-                region=item.get("region"),
-                text=item.get("_geo_text", ""),
-            )
+            geo_key = (item.country, item.region, item.geo_text)
+            geo = previous_geo.get(geo_key)
+            if geo is None:
+                geo = self.geo_resolver.resolve(
+                    country=geo_key[0],
+                    region=geo_key[1],
+                    text=geo_key[2],
+                )
+            geo_memo[geo_key] = geo
+            # Low-cardinality labels: intern so every cached item points at one copy.
             output.append(
                 {
                     "id": index,
-                    "title": item["title"],
-                    "source": item["source"],
-                    "url": item["url"],
-                    "published_at": item["published_at"],
-                    "category": item["category"],
-                    "region": geo["region"],
-                    "country": geo["country"],
+                    "title": item.title,
+                    "source": sys.intern(item.source),
+                    "url": item.url,
+                    "published_at": item.published_at,
+                    "category": sys.intern(item.category),
+                    "region": sys.intern(geo["region"]),
+                    "country": sys.intern(geo["country"]),
                     "lat": geo["lat"],
                     "lon": geo["lon"],
                     "location_label": geo["location_label"],
                 }
             )
+        self._geo_memo = geo_memo
         return output
 
-    def _fetch_source(self, source: FeedSource) -> list[dict[str, Any]]:
-        for url in source.urls:
+    def _fetch_source(self, source: FeedSource) -> list[FeedEntry]:
+        for attempt, url in enumerate(source.urls):
+            # Fallback URLs usually share a host with the primary one; space them out.
+            if attempt and self.request_delay_seconds > 0:
+                time.sleep(self.request_delay_seconds)
             try:
                 xml_bytes = self._download(url)
                 items = self._parse_feed(xml_bytes, source.name)
@@ -433,55 +527,31 @@ class NewsService:
         return []
 
     def _download(self, url: str) -> bytes:
-        request = Request(
+        return fetch_bytes(
             url,
             headers={
                 "User-Agent": USER_AGENT,
                 "Accept": "application/rss+xml, application/atom+xml, text/xml;q=0.9, */*;q=0.8",
-                "Accept-Encoding": "identity",
             },
+            timeout_seconds=self.request_timeout_seconds,
         )
-        with urlopen(request, timeout=self.request_timeout_seconds) as response:
-            return response.read()
 
-    def _parse_feed(self, xml_bytes: bytes, source_name: str) -> list[dict[str, Any]]:
-        root = ET.fromstring(xml_bytes)
-        parsed_items: list[dict[str, Any]] = []
+    def _parse_feed(self, xml_bytes: bytes, source_name: str) -> list[FeedEntry]:
+        parsed_items: list[FeedEntry] = []
 
-        for node in root.iter():
-            if _local_name(node.tag) not in {"item", "entry"}:
+        # Stream the document and stop once enough entries are kept, rather than
+        # building the whole tree for feeds that carry hundreds of items.
+        for _, node in ET.iterparse(io.BytesIO(xml_bytes), events=("end",)):
+            if _local_name(node.tag) not in ENTRY_TAGS:
                 continue
 
-            title = _first_child_text(node, {"title"})
-            link = _extract_link(node)
-            if not title or not link:
+            item = _parse_entry(node, source_name)
+            node.clear()
+            if item is None:
                 continue
-
-            summary = _first_child_text(node, {"description", "summary", "content", "encoded"})
-            published_raw = _first_child_text(
-                node, {"pubdate", "published", "updated", "date"}
-            )
-            published_dt = _parse_datetime(published_raw)
-
-            normalized_title = _normalize_text(title)
-            combined_text = f"{title} {summary}"
-            category = _classify_category(combined_text, source_name)
-            region, country = _detect_region_country(combined_text)
-
-            parsed_items.append(
-                {
-                    "title": title.strip(),
-                    "source": source_name,
-                    "url": link.strip(),
-                    "published_at": _utc_iso(published_dt),
-                    "category": category,
-                    "region": region,
-                    "country": country,
-                    "_geo_text": combined_text,
-                    "_published_epoch": published_dt.timestamp(),
-                    "_title_hash": hashlib.sha256(normalized_title.encode("utf-8")).hexdigest(),
-                }
-            )
+            parsed_items.append(item)
+            if len(parsed_items) >= self.max_items_per_source:
+                break
         return parsed_items
 
     @staticmethod
@@ -509,34 +579,93 @@ class NewsService:
         return sources
 
 
-def _classify_category(text: str, source_name: str) -> str:
-    normalized = f" {_normalize_text(text)} "
+def _parse_entry(node: ET.Element, source_name: str) -> FeedEntry | None:
+    title = _first_child_text(node, TITLE_TAGS)
+    link = _extract_link(node)
+    if not title or not link:
+        return None
 
-    for category, keywords in CATEGORY_RULES:
-        for keyword in keywords:
-            normalized_keyword = _normalize_text(keyword)
-            if normalized_keyword and f" {normalized_keyword} " in normalized:
-                return category
+    summary = _first_child_text(node, SUMMARY_TAGS)
+    published_raw = _first_child_text(node, PUBLISHED_TAGS)
+    published_dt = _parse_datetime(published_raw)
 
-    source_normalized = _normalize_text(source_name)
-    if "imf" in source_normalized or "world bank" in source_normalized or "afdb" in source_normalized:
-        return "economy"
-    return "geopolitics"
+    # Normalize title and summary once; every classifier works off these tokens.
+    normalized_title = normalize_text(title)
+    normalized_text = " ".join(
+        part for part in (normalized_title, normalize_text(summary)) if part
+    )
+    tokens = normalized_text.split()
+    category, region, country = _classify_tokens(tokens, source_name)
+
+    return FeedEntry(
+        title=title.strip(),
+        source=source_name,
+        url=link.strip(),
+        published_at=_utc_iso(published_dt),
+        category=category,
+        region=region,
+        country=country,
+        geo_text=normalized_text,
+        published_epoch=published_dt.timestamp(),
+        title_hash=title_fingerprint(normalized_title),
+    )
+
+
+def _classify_tokens(tokens: list[str], source_name: str) -> tuple[str, str, str]:
+    """Return (category, region, country) for an entry's normalized tokens.
 
+    Categories keep the CATEGORY_RULES precedence; the country is the one mentioned
+    first, so title mentions win over summary mentions.
+    """
+    category_priority, country_priority = _match_keywords(tokens)
+    if category_priority is not None:
+        category = NORMALIZED_CATEGORY_RULES[category_priority][0]
+    else:
+        category = _source_fallback_category(source_name)
 
-def _detect_region_country(text: str) -> tuple[str, str]:
-    normalized = f" {_normalize_text(text)} "
-    for country, region, keywords in NORMALIZED_COUNTRY_SPECS:
-        for keyword in keywords:
-            if f" {keyword} " in normalized:
-                return region, country
-    return "Global", "Global"
+    if country_priority is None:
+        return category, "Global", "Global"
+    country, region, _ = NORMALIZED_COUNTRY_SPECS[country_priority]
+    return category, region, country
+
+
+def _match_keywords(tokens: list[str]) -> tuple[int | None, int | None]:
+    category: int | None = None
+    country: int | None = None
+    for position, token in enumerate(tokens):
+        candidates = KEYWORD_INDEX.get(token)
+        if not candidates:
+            continue
+        for keyword_tokens, kind, priority in candidates:
+            if kind == "category":
+                if category is not None and priority >= category:
+                    continue
+            elif country is not None:
+                continue
+            if len(keyword_tokens) == 1 or tuple(
+                tokens[position : position + len(keyword_tokens)]
+            ) == keyword_tokens:
+                if kind == "category":
+                    category = priority
+                else:
+                    country = priority
+        if category == 0 and country is not None:
+            break
+    return category, country
+
+
+@lru_cache(maxsize=128)
+def _source_fallback_category(source_name: str) -> str:
+    source_normalized = normalize_text(source_name)
+    for marker, category in SOURCE_FALLBACK_CATEGORIES:
+        if marker in source_normalized:
+            return category
+    return "geopolitics"
 
 
-def _first_child_text(node: ET.Element, local_names: set[str]) -> str:
-    target_names = {name.lower() for name in local_names}
-    for child in list(node):
-        if _local_name(child.tag) not in target_names:
+def _first_child_text(node: ET.Element, local_names: frozenset[str]) -> str:
+    for child in node:
+        if _local_name(child.tag) not in local_names:
             continue
         text_value = " ".join(child.itertext()).strip()
         if text_value:
@@ -545,30 +674,35 @@ def _first_child_text(node: ET.Element, local_names: set[str]) -> str:
 
 
 def _extract_link(node: ET.Element) -> str:
-    for child in list(node):
-        if _local_name(child.tag) != "link":
-            continue
-        href = child.attrib.get("href")
-        if href:
-            return href.strip()
-        text_link = " ".join(child.itertext()).strip()
-        if text_link:
-            return text_link
-
-    for child in list(node):
-        if _local_name(child.tag) not in {"guid", "id"}:
-            continue
-        candidate = " ".join(child.itertext()).strip()
-        if candidate.startswith("http://") or candidate.startswith("https://"):
-            return candidate
-    return ""
+    # <link> wins wherever it appears; an http(s) guid/id is only a fallback.
+    fallback = ""
+    for child in node:
+        name = _local_name(child.tag)
+        if name == "link":
+            href = child.attrib.get("href")
+            if href:
+                return href.strip()
+            text_link = " ".join(child.itertext()).strip()
+            if text_link:
+                return text_link
+        elif not fallback and name in LINK_FALLBACK_TAGS:
+            candidate = " ".join(child.itertext()).strip()
+            if candidate.startswith("http://") or candidate.startswith("https://"):
+                fallback = candidate
+    return fallback
 
 
 def _parse_datetime(value: str) -> datetime:
-    if not value:
-        return datetime.now(timezone.utc)
+    parsed = _parse_datetime_cached(value.strip()) if value else None
+    return parsed or datetime.now(timezone.utc)
+
 
-    text = value.strip()
+# Feeds repeat the same timestamp strings across entries and refreshes. Misses are
+# cached as None so unparseable values still fall back to the current time.
+@lru_cache(maxsize=4096)
+def _parse_datetime_cached(text: str) -> datetime | None:
+    if not text:
+        return None
 
     try:
         parsed = parsedate_to_datetime(text)
@@ -587,16 +721,20 @@ def _parse_datetime(value: str) -> datetime:
         except Exception:
             continue
 
-    return datetime.now(timezone.utc)
+    return None
 
 
+# Feeds use a few dozen distinct tags, so resolve each qualified tag only once.
+@lru_cache(maxsize=512)
 def _local_name(tag: str) -> str:
     return tag.rsplit("}", 1)[-1].lower()
 
 
 def _strip_html(text: str) -> str:
-    cleaned = HTML_TAG_RE.sub(" ", text)
-    return MULTISPACE_RE.sub(" ", cleaned).strip()
+    # Most titles and many summaries carry no markup at all; skip the regex for those.
+    if "<" in text:
+        text = HTML_TAG_RE.sub(" ", text)
+    return " ".join(text.split())
 
 
 def _utc_iso(value: datetime) -> str:
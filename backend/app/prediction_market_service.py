@@ -2,20 +2,26 @@
 
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
-import json
+from concurrent.futures import Future, ThreadPoolExecutor
 import logging
 import os
-import ssl
+import sys
 import threading
 import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import orjson
+
+from app.http_pool import fetch_bytes
+from app.providers.common import ISO_UTC_FORMAT
 
 LOGGER = logging.getLogger(__name__)
 USER_AGENT = "WorldMonitor/0.8 (+http://localhost)"
+KALSHI_LIVE_STATUSES = frozenset({"active", "open", "initialized"})
 
 
 class PredictionMarketService:
@@ -26,50 +32,59 @@ class PredictionMarketService:
         )
         self.max_items_per_source = max(10, int(os.getenv("PREDICTION_MAX_ITEMS_PER_SOURCE", "80")))
 
-        self.polymarket_url = os.getenv(
-            "POLYMARKET_API_URL",
-            "https://gamma-api.polymarket.com/markets?closed=false&limit=80",
+        # Only the first max_items_per_source markets are ever parsed, so ask the
+        # APIs for no more than that rather than downloading rows we slice away.
+        self.polymarket_url = _cap_limit(
+            os.getenv(
+                "POLYMARKET_API_URL",
+                "https://gamma-api.polymarket.com/markets?closed=false&limit=80",
+            ),
+            self.max_items_per_source,
         )
-        self.kalshi_url = os.getenv(
-            "KALSHI_API_URL",
-            "https://api.elections.kalshi.com/trade-api/v2/markets?status=open&limit=80",
+        self.kalshi_url = _cap_limit(
+            os.getenv(
+                "KALSHI_API_URL",
+                "https://api.elections.kalshi.com/trade-api/v2/markets?status=open&limit=80",
+            ),
+            self.max_items_per_source,
         )
 
-        self._ssl_context = ssl.create_default_context()
         self._state_lock = threading.Lock()
         self._refresh_lock = threading.Lock()
-        self._cache: list[dict[str, Any]] = []
-        self._sources: list[dict[str, Any]] = [
+        # Background refreshes reuse one long-lived worker instead of starting a
+        # thread per stale read; the pending future doubles as the in-flight guard.
+        self._refresh_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="prediction-refresh"
+        )
+        self._refresh_future: Future[None] | None = None
+        self._refresh_future_forced = False
+        self._stopped = False
+        # Both are replaced wholesale on refresh and never mutated afterwards, so
+        # readers can hand out the same item dicts without copying them.
+        self._cache: tuple[dict[str, Any], ...] = ()
+        self._sources: tuple[dict[str, Any], ...] = (
             {"name": "Polymarket", "ok": False, "fetched": 0, "last_error": "not yet fetched"},
             {"name": "Kalshi", "ok": False, "fetched": 0, "last_error": "not yet fetched"},
-        ]
+        )
         self._last_updated: str | None = None
         self._cached_at = 0.0
+        self._markets_json: bytes | None = None
 
     def get_markets(self, force_refresh: bool = False) -> dict[str, Any]:
+        self._ensure_cache(force_refresh)
         with self._state_lock:
-            has_cache = bool(self._cache)
-
-        if force_refresh or not has_cache:
-            self.refresh(force=True)
-        else:
-            self._refresh_if_stale()
+            return self._markets_payload()
 
+    def get_markets_json(self, force_refresh: bool = False) -> bytes:
+        self._ensure_cache(force_refresh)
         with self._state_lock:
-            return {
-                "items": [dict(item) for item in self._cache],
-                "sources": [dict(source) for source in self._sources],
-                "last_updated": self._last_updated,
-            }
+            # Serialized once per snapshot; refresh clears it when the data changes.
+            if self._markets_json is None:
+                self._markets_json = orjson.dumps(self._markets_payload())
+            return self._markets_json
 
     def get_status(self) -> dict[str, Any]:
-        with self._state_lock:
-            has_cache = bool(self._cache)
-
-        if not has_cache:
-            self.refresh(force=True)
-        else:
-            self._refresh_if_stale()
+        self._ensure_cache(force_refresh=False)
 
         with self._state_lock:
             active_markets = sum(1 for item in self._cache if _is_active_status(item.get("status")))
@@ -79,18 +94,19 @@ class PredictionMarketService:
                 "healthy_sources": sum(1 for source in self._sources if source.get("ok")),
                 "total_sources": len(self._sources),
                 "last_updated": self._last_updated,
-                "sources": [dict(source) for source in self._sources],
+                "sources": list(self._sources),
             }
 
+    def stop(self) -> None:
+        """Shut down the refresh worker; queued refreshes are dropped, not awaited."""
+        with self._state_lock:
+            self._stopped = True
+        self._refresh_executor.shutdown(wait=False, cancel_futures=True)
+
     def refresh_async(self, force: bool = False) -> None:
         if self._refresh_lock.locked():
             return
-        thread = threading.Thread(
-            target=self.refresh,
-            kwargs={"force": force},
-            daemon=True,
-        )
-        thread.start()
+        self._submit_refresh(force)
 
     def refresh(self, force: bool = False) -> None:
         now = time.time()
@@ -114,8 +130,10 @@ class PredictionMarketService:
             source_rows: list[dict[str, Any]] = []
 
             with ThreadPoolExecutor(max_workers=2) as executor:
-                poly_future = executor.submit(self._fetch_polymarket)
-                kalshi_future = executor.submit(self._fetch_kalshi)
+                # One fallback timestamp per refresh for markets without their own.
+                now_iso = _utc_now_iso()
+                poly_future = executor.submit(self._fetch_polymarket, now_iso)
+                kalshi_future = executor.submit(self._fetch_kalshi, now_iso)
                 poly_items, poly_error = poly_future.result()
                 kalshi_items, kalshi_error = kalshi_future.result()
 
@@ -138,30 +156,63 @@ class PredictionMarketService:
                 ]
             )
 
-            aggregated.sort(
-                key=lambda item: (
-                    _to_float(item.get("volume_24h")) or 0.0,
-                    _to_float(item.get("volume_total")) or 0.0,
-                    str(item.get("title", "")),
-                ),
-                reverse=True,
-            )
+            _sort_by_volume(aggregated)
 
             with self._state_lock:
                 if aggregated:
-                    self._cache = aggregated
+                    self._cache = tuple(aggregated)
                     self._last_updated = _utc_now_iso()
                     self._cached_at = time.time()
                 elif not self._cache:
-                    self._cache = []
+                    self._cache = ()
                     self._last_updated = _utc_now_iso()
                     self._cached_at = time.time()
-                self._sources = source_rows
+                self._sources = tuple(source_rows)
+                self._markets_json = None
         except Exception:
             LOGGER.exception("Prediction market refresh failed.")
         finally:
             self._refresh_lock.release()
 
+    def _submit_refresh(self, force: bool) -> Future[None]:
+        """Queue a refresh on the worker, joining one already pending if it covers ``force``."""
+        with self._state_lock:
+            if self._stopped:
+                # After shutdown readers keep getting the last snapshot.
+                stopped: Future[None] = Future()
+                stopped.set_result(None)
+                return stopped
+            pending = self._refresh_future
+            if pending is not None and not pending.done():
+                if self._refresh_future_forced or not force:
+                    return pending
+            self._refresh_future = self._refresh_executor.submit(self.refresh, force=force)
+            self._refresh_future_forced = force
+            return self._refresh_future
+
+    def _ensure_cache(self, force_refresh: bool) -> None:
+        with self._state_lock:
+            has_cache = bool(self._cache)
+
+        if force_refresh or not has_cache:
+            # Parse and transform on the refresh worker; concurrent forced reads
+            # wait on the same future instead of each refreshing inline.
+            try:
+                self._submit_refresh(force=True).result(
+                    timeout=self.request_timeout_seconds * 2
+                )
+            except TimeoutError:
+                LOGGER.warning("Prediction market refresh still running; serving cached data.")
+        else:
+            self._refresh_if_stale()
+
+    def _markets_payload(self) -> dict[str, Any]:
+        return {
+            "items": list(self._cache),
+            "sources": list(self._sources),
+            "last_updated": self._last_updated,
+        }
+
     def _refresh_if_stale(self) -> None:
         now = time.time()
         with self._state_lock:
@@ -170,7 +221,7 @@ class PredictionMarketService:
         if stale or empty:
             self.refresh_async(force=False)
 
-    def _fetch_polymarket(self) -> tuple[list[dict[str, Any]], str | None]:
+    def _fetch_polymarket(self, now_iso: str) -> tuple[list[dict[str, Any]], str | None]:
         try:
             payload = self._download_json(self.polymarket_url)
             if not isinstance(payload, list):
@@ -214,18 +265,21 @@ class PredictionMarketService:
 
                 market_id = str(raw.get("id", "")).strip() or slug or title
                 status = "active" if bool(raw.get("active", False)) else "inactive"
+                # Categories repeat across markets; intern so cached items share them.
+                category = sys.intern(str(raw.get("category", "")).strip())
+                ticker = slug or market_id
 
                 output.append(
                     {
                         "id": f"polymarket:{market_id}",
                         "provider": "Polymarket",
-                        "ticker": slug or market_id,
+                        "ticker": ticker,
                         "title": title,
-                        "subtitle": str(raw.get("category", "")).strip() or None,
+                        "subtitle": category or None,
                         "category": _classify_market(
                             title=title,
-                            subtitle=str(raw.get("category", "")).strip(),
-                            ticker=slug or market_id,
+                            subtitle=category,
+                            ticker=ticker,
                         ),
                         "url": url or None,
                         "status": status,
@@ -240,7 +294,7 @@ class PredictionMarketService:
                             raw,
                             ["endDateIso", "endDate", "closedTime"],
                         ),
-                        "updated_at": _first_text(raw, ["updatedAt", "createdAt"]) or _utc_now_iso(),
+                        "updated_at": _first_text(raw, ["updatedAt", "createdAt"]) or now_iso,
                     }
                 )
 
@@ -252,7 +306,7 @@ class PredictionMarketService:
             LOGGER.warning("Polymarket parse failed: %s", exc)
             return [], str(exc)
 
-    def _fetch_kalshi(self) -> tuple[list[dict[str, Any]], str | None]:
+    def _fetch_kalshi(self, now_iso: str) -> tuple[list[dict[str, Any]], str | None]:
         try:
             payload = self._download_json(self.kalshi_url)
             if not isinstance(payload, dict):
@@ -267,20 +321,23 @@ class PredictionMarketService:
                 if not isinstance(raw, dict):
                     continue
 
-                status = str(raw.get("status", "")).strip().lower() or "unknown"
-                if status not in {"active", "open", "initialized"}:
+                status = str(raw.get("status", "")).strip().lower()
+                if status not in KALSHI_LIVE_STATUSES:
                     continue
+                status = sys.intern(status)
 
                 title = str(raw.get("title", "")).strip()
                 if not title:
                     continue
 
                 ticker = str(raw.get("ticker", "")).strip()
+                subtitle = str(raw.get("subtitle", "")).strip()
                 yes_bid = _to_float(raw.get("yes_bid_dollars"))
                 yes_ask = _to_float(raw.get("yes_ask_dollars"))
                 no_bid = _to_float(raw.get("no_bid_dollars"))
                 no_ask = _to_float(raw.get("no_ask_dollars"))
 
+                liquidity_dollars = raw.get("liquidity_dollars")
                 yes_price = _midpoint(yes_bid, yes_ask)
                 no_price = _midpoint(no_bid, no_ask)
 
@@ -296,10 +353,10 @@ class PredictionMarketService:
                         "provider": "Kalshi",
                         "ticker": ticker or None,
                         "title": title,
-                        "subtitle": str(raw.get("subtitle", "")).strip() or None,
+                        "subtitle": subtitle or None,
                         "category": _classify_market(
                             title=title,
-                            subtitle=str(raw.get("subtitle", "")).strip(),
+                            subtitle=subtitle,
                             ticker=ticker,
                         ),
                         "url": f"https://kalshi.com/markets/{ticker}" if ticker else None,
@@ -310,13 +367,13 @@ class PredictionMarketService:
                         "volume_24h": _round2(_to_float(raw.get("volume_24h"))),
                         "volume_total": _round2(_to_float(raw.get("volume"))),
                         "liquidity": _round2(
-                            _to_float(raw.get("liquidity_dollars"))
-                            if raw.get("liquidity_dollars") is not None
+                            _to_float(liquidity_dollars)
+                            if liquidity_dollars is not None
                             else _to_float(raw.get("liquidity"))
                         ),
                         "open_interest": _round2(_to_float(raw.get("open_interest"))),
                         "close_time": _first_text(raw, ["close_time", "expiration_time"]),
-                        "updated_at": _first_text(raw, ["updated_time", "created_time"]) or _utc_now_iso(),
+                        "updated_at": _first_text(raw, ["updated_time", "created_time"]) or now_iso,
                     }
                 )
 
@@ -329,21 +386,23 @@ class PredictionMarketService:
             return [], str(exc)
 
     def _download_json(self, url: str) -> Any:
-        request = Request(
+        body = fetch_bytes(
             url,
-            headers={
-                "User-Agent": USER_AGENT,
-                "Accept": "application/json",
-                "Accept-Encoding": "identity",
-            },
+            headers={"User-Agent": USER_AGENT, "Accept": "application/json"},
+            timeout_seconds=self.request_timeout_seconds,
         )
-        with urlopen(
-            request,
-            timeout=self.request_timeout_seconds,
-            context=self._ssl_context,
-        ) as response:
-            raw = response.read().decode("utf-8", errors="replace")
-        return json.loads(raw)
+        return orjson.loads(body)
+
+
+def _cap_limit(url: str, max_items: int) -> str:
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    current = next((value for key, value in query if key == "limit"), None)
+    if current is not None and current.isdigit() and int(current) <= max_items:
+        return url
+    query = [(key, value) for key, value in query if key != "limit"]
+    query.append(("limit", str(max_items)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
 
 
 def _as_list(value: Any) -> list[Any]:
@@ -354,9 +413,9 @@ def _as_list(value: Any) -> list[Any]:
         if not text:
             return []
         try:
-            decoded = json.loads(text)
+            decoded = orjson.loads(text)
             return decoded if isinstance(decoded, list) else []
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             return []
     return []
 
@@ -370,15 +429,17 @@ def _extract_binary_prices(
     pairs = zip(outcomes, outcome_prices)
 
     for outcome_raw, price_raw in pairs:
-        outcome = str(outcome_raw).strip().lower()
+        side = _outcome_side(str(outcome_raw))
+        if side is None:
+            continue
         price = _to_float(price_raw)
         if price is None:
             continue
         if 0.0 <= price <= 1.0:
             price *= 100.0
-        if "yes" in outcome:
+        if side == "yes":
             yes_price = price
-        elif "no" in outcome:
+        else:
             no_price = price
 
     if yes_price is not None and no_price is None and 0.0 <= yes_price <= 100.0:
@@ -389,6 +450,18 @@ def _extract_binary_prices(
     return yes_price, no_price
 
 
+# Outcome labels repeat heavily across markets ("Yes", "No", candidate names),
+# so classify each distinct label once.
+@lru_cache(maxsize=1024)
+def _outcome_side(outcome: str) -> str | None:
+    lowered = outcome.lower()
+    if "yes" in lowered:
+        return "yes"
+    if "no" in lowered:
+        return "no"
+    return None
+
+
 def _midpoint(a: float | None, b: float | None) -> float | None:
     if a is not None and b is not None:
         return (a + b) / 2.0
@@ -409,9 +482,26 @@ def _as_percent(value: float | None) -> float | None:
     return _round2(value)
 
 
+def _sort_by_volume(items: list[dict[str, Any]]) -> None:
+    # Volumes are already rounded floats (or None) when items are built, so sort
+    # on the raw fields one column at a time, least significant first. Stable
+    # passes give the same order as a (volume_24h, volume_total, title) tuple key
+    # without re-coercing values or building a tuple per item.
+    items.sort(key=lambda item: item["title"], reverse=True)
+    items.sort(key=lambda item: item["volume_total"] or 0.0, reverse=True)
+    items.sort(key=lambda item: item["volume_24h"] or 0.0, reverse=True)
+
+
 def _to_float(value: Any) -> float | None:
     if value is None:
         return None
+    # orjson hands back floats and ints for most numeric fields; skip the
+    # exception-guarded path for them.
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
     try:
         return float(value)
     except (TypeError, ValueError):
@@ -436,9 +526,7 @@ def _first_text(payload: dict[str, Any], keys: list[str]) -> str | None:
 
 
 def _utc_now_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace(
-        "+00:00", "Z"
-    )
+    return datetime.now(timezone.utc).strftime(ISO_UTC_FORMAT)
 
 
 def _classify_market(*, title: str, subtitle: str, ticker: str | None) -> str:
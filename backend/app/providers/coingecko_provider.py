@@ -2,37 +2,107 @@
 
 from __future__ import annotations
 
-import json
+import threading
+import time
+from concurrent.futures import Future
 from datetime import datetime, timezone
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlencode
-from urllib.request import Request, urlopen
 
+import orjson
+
+from app.http_pool import fetch_bytes
 from app.providers.common import ProviderHealth, ProviderQuote, parse_float, utc_now_iso
+from app.shared_cache import SharedCache
 
 COINGECKO_URL = "https://api.coingecko.com/api/v3/simple/price"
 COINGECKO_USER_AGENT = "WorldMonitor/0.4 (+http://localhost)"
+COINGECKO_SHARED_KEY = "shared:market:cg:{coin_id}"
+COINGECKO_SHARED_TTL_SECONDS = 10
 
 
 class CoinGeckoProvider:
     name = "coingecko"
 
-    def __init__(self, timeout_seconds: float) -> None:
+    def __init__(
+        self, timeout_seconds: float, shared_cache: SharedCache | None = None
+    ) -> None:
         self.timeout_seconds = timeout_seconds
+        self.shared_cache = shared_cache or SharedCache()
         self._health = ProviderHealth()
+        self._inflight_lock = threading.Lock()
+        self._inflight: dict[str, Future[ProviderQuote]] = {}
+        # Per-coin (expires_at, quote) memo so overlapping callers within the TTL
+        # skip the round-trip even when no shared cache is configured.
+        self._quote_cache: dict[str, tuple[float, ProviderQuote]] = {}
 
     def fetch_prices(self, coin_ids: list[str]) -> dict[str, ProviderQuote]:
         if not coin_ids:
             return {}
 
+        quotes = self._read_local_quotes(coin_ids)
+        missing = [coin_id for coin_id in coin_ids if coin_id not in quotes]
+        if not missing:
+            return quotes
+
+        quotes.update(self._read_shared_quotes(missing))
+        missing = [coin_id for coin_id in missing if coin_id not in quotes]
+        if not missing:
+            return quotes
+
+        # Coalesce concurrent callers so each coin is requested once per process.
+        owned: dict[str, Future[ProviderQuote]] = {}
+        waiting: dict[str, Future[ProviderQuote]] = {}
+        with self._inflight_lock:
+            for coin_id in missing:
+                future = self._inflight.get(coin_id)
+                if future is None:
+                    future = self._inflight[coin_id] = Future()
+                    owned[coin_id] = future
+                else:
+                    waiting[coin_id] = future
+
+        if owned:
+            try:
+                fetched = self._fetch_upstream(list(owned))
+                for coin_id, future in owned.items():
+                    future.set_result(fetched[coin_id])
+            except BaseException as exc:
+                for future in owned.values():
+                    if not future.done():
+                        future.set_exception(exc)
+                raise
+            finally:
+                with self._inflight_lock:
+                    for coin_id in owned:
+                        self._inflight.pop(coin_id, None)
+            quotes.update(fetched)
+
+        for coin_id, future in waiting.items():
+            try:
+                quotes[coin_id] = future.result(timeout=self.timeout_seconds)
+            except Exception as exc:
+                quotes[coin_id] = ProviderQuote(
+                    price=None,
+                    change_pct=None,
+                    as_of=utc_now_iso(),
+                    error=f"{type(exc).__name__}: {exc}",
+                )
+
+        return {coin_id: quotes[coin_id] for coin_id in coin_ids}
+
+    def _fetch_upstream(self, coin_ids: list[str]) -> dict[str, ProviderQuote]:
         try:
             payload = self._request_payload(coin_ids)
             self._record_success()
-            return {
+            quotes = {
                 coin_id: self._parse_coin_payload(coin_id, payload.get(coin_id))
                 for coin_id in coin_ids
             }
-        except (HTTPError, URLError, TimeoutError, ValueError, json.JSONDecodeError) as exc:
+            self._write_local_quotes(quotes)
+            self._write_shared_quotes(quotes)
+            return quotes
+        except (HTTPError, URLError, TimeoutError, ValueError) as exc:
             message = f"{type(exc).__name__}: {exc}"
             self._record_error(message)
             return {
@@ -52,6 +122,59 @@ class CoinGeckoProvider:
             "last_error": self._health.last_error,
         }
 
+    def _read_local_quotes(self, coin_ids: list[str]) -> dict[str, ProviderQuote]:
+        now = time.monotonic()
+        quotes: dict[str, ProviderQuote] = {}
+        with self._inflight_lock:
+            for coin_id in coin_ids:
+                cached = self._quote_cache.get(coin_id)
+                if cached is not None and cached[0] > now:
+                    quotes[coin_id] = cached[1]
+        return quotes
+
+    def _write_local_quotes(self, quotes: dict[str, ProviderQuote]) -> None:
+        expires_at = time.monotonic() + COINGECKO_SHARED_TTL_SECONDS
+        with self._inflight_lock:
+            for coin_id, quote in quotes.items():
+                if quote.price is not None:
+                    self._quote_cache[coin_id] = (expires_at, quote)
+
+    def _read_shared_quotes(self, coin_ids: list[str]) -> dict[str, ProviderQuote]:
+        keys = [COINGECKO_SHARED_KEY.format(coin_id=coin_id) for coin_id in coin_ids]
+        quotes: dict[str, ProviderQuote] = {}
+        for coin_id, raw in zip(coin_ids, self.shared_cache.get_many(keys)):
+            if raw is None:
+                continue
+            try:
+                payload = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                continue
+            if not isinstance(payload, dict):
+                continue
+            price = parse_float(payload.get("price"))
+            if price is None:
+                continue
+            quotes[coin_id] = ProviderQuote(
+                price=price,
+                change_pct=parse_float(payload.get("change_pct")),
+                as_of=payload.get("as_of") or utc_now_iso(),
+                error=None,
+            )
+        return quotes
+
+    def _write_shared_quotes(self, quotes: dict[str, ProviderQuote]) -> None:
+        for coin_id, quote in quotes.items():
+            if quote.price is None:
+                continue
+            value = orjson.dumps(
+                {"price": quote.price, "change_pct": quote.change_pct, "as_of": quote.as_of}
+            )
+            self.shared_cache.set(
+                COINGECKO_SHARED_KEY.format(coin_id=coin_id),
+                value,
+                COINGECKO_SHARED_TTL_SECONDS,
+            )
+
     def _request_payload(self, coin_ids: list[str]) -> dict[str, object]:
         params = urlencode(
             {
@@ -62,17 +185,13 @@ class CoinGeckoProvider:
             }
         )
         url = f"{COINGECKO_URL}?{params}"
-        request = Request(
+        body = fetch_bytes(
             url,
-            headers={
-                "User-Agent": COINGECKO_USER_AGENT,
-                "Accept": "application/json",
-            },
+            headers={"User-Agent": COINGECKO_USER_AGENT, "Accept": "application/json"},
+            timeout_seconds=self.timeout_seconds,
         )
-        with urlopen(request, timeout=self.timeout_seconds) as response:
-            raw = response.read().decode("utf-8", errors="replace")
+        payload = orjson.loads(body)
 
-        payload = json.loads(raw)
         if not isinstance(payload, dict):
             raise ValueError("Unexpected payload shape")
         return payload
@@ -5,6 +5,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
+# Second-precision UTC timestamps with a literal Z, formatted directly rather
+# than via isoformat() plus a "+00:00" string replace.
+ISO_UTC_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
 
 @dataclass(frozen=True)
 class ProviderQuote:
@@ -22,9 +26,7 @@ class ProviderHealth:
 
 
 def utc_now_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace(
-        "+00:00", "Z"
-    )
+    return datetime.now(timezone.utc).strftime(ISO_UTC_FORMAT)
 
 
 def normalize_iso(date_value: str | None, time_value: str | None = None) -> str | None:
@@ -48,9 +50,7 @@ def normalize_iso(date_value: str | None, time_value: str | None = None) -> str
     if parsed.tzinfo is None:
         parsed = parsed.replace(tzinfo=timezone.utc)
 
-    return parsed.astimezone(timezone.utc).replace(microsecond=0).isoformat().replace(
-        "+00:00", "Z"
-    )
+    return parsed.astimezone(timezone.utc).strftime(ISO_UTC_FORMAT)
 
 
 def parse_float(value: str | int | float | None) -> float | None:
@@ -2,17 +2,19 @@
 
 from __future__ import annotations
 
+import codecs
 import csv
-import io
+from collections.abc import Iterable, Iterator
 from datetime import date
+from functools import lru_cache
 from urllib.error import HTTPError, URLError
 from urllib.parse import quote
-from urllib.request import Request, urlopen
 
+from app.http_pool import iter_lines
 from app.providers.common import ProviderHealth, ProviderQuote, normalize_iso, parse_float, utc_now_iso
 
 STOOQ_QUOTE_URL = "https://stooq.com/q/l/?s={symbol}&f=sd2t2ohlcv&e=csv"
-STOOQ_DAILY_URL = "https://stooq.com/q/d/l/?s={symbol}&i=d&d1={start}&d2={end}"
+STOOQ_DAILY_URL = "https://stooq.com/q/d/l/?s={symbol}&i=d"
 STOOQ_USER_AGENT = "WorldMonitor/0.4 (+http://localhost)"
 
 
@@ -25,9 +27,7 @@ class StooqProvider:
 
     def fetch_quote(self, symbol: str) -> ProviderQuote:
         try:
-            url = STOOQ_QUOTE_URL.format(symbol=quote(symbol))
-            csv_text = self._download_text(url)
-            row = _parse_quote_row(csv_text)
+            row = _parse_quote_row(self._download_rows(_quote_url(symbol)))
             if row is None:
                 raise ValueError("No quote row")
 
@@ -58,21 +58,19 @@ class StooqProvider:
                 error=message,
             )
 
-    def fetch_daily_rows(
+    def fetch_daily_closes(
         self, symbol: str, start_date: date, end_date: date
-    ) -> list[dict[str, str]]:
-        url = STOOQ_DAILY_URL.format(
-            symbol=quote(symbol),
-            start=start_date.strftime("%Y%m%d"),
-            end=end_date.strftime("%Y%m%d"),
+    ) -> list[tuple[str, float]]:
+        url = (
+            f"{_daily_url(symbol)}"
+            f"&d1={start_date.strftime('%Y%m%d')}&d2={end_date.strftime('%Y%m%d')}"
         )
-        csv_text = self._download_text(url)
-        rows = _parse_daily_rows(csv_text)
-        if not rows:
+        closes = _parse_daily_closes(self._download_rows(url))
+        if not closes:
             raise ValueError(f"No daily rows for {symbol}")
 
         self._record_success()
-        return rows
+        return closes
 
     def health(self) -> dict[str, object]:
         return {
@@ -90,53 +88,76 @@ class StooqProvider:
         self._health.ok = False
         self._health.last_error = message
 
-    def _download_text(self, url: str) -> str:
-        request = Request(
+    def _download_rows(self, url: str) -> Iterator[list[str]]:
+        lines = iter_lines(
             url,
             headers={
                 "User-Agent": STOOQ_USER_AGENT,
                 "Accept": "text/csv, text/plain;q=0.9, */*;q=0.8",
-                "Accept-Encoding": "identity",
             },
+            timeout_seconds=self.timeout_seconds,
         )
-        with urlopen(request, timeout=self.timeout_seconds) as response:
-            return response.read().decode("utf-8", errors="replace")
+        # Decode and parse rows as the pooled response streams in (gzip is undone
+        # by urllib3), so large daily series are never buffered whole.
+        return csv.reader(codecs.iterdecode(lines, "utf-8", errors="replace"))
 
 
-def _parse_quote_row(csv_text: str) -> list[str] | None:
-    reader = csv.reader(io.StringIO(csv_text))
-    rows: list[list[str]] = []
-    for row in reader:
-        cleaned = [cell.strip() for cell in row]
-        if any(cleaned):
-            rows.append(cleaned)
-
-    if not rows:
-        return None
-
-    first = rows[0]
-    if first and first[0].lower() == "symbol":
-        return rows[1] if len(rows) > 1 else None
-    return first
+# The symbol set is small and static, so build each URL once and reuse it.
+@lru_cache(maxsize=64)
+def _quote_url(symbol: str) -> str:
+    return STOOQ_QUOTE_URL.format(symbol=quote(symbol))
 
 
-def _parse_daily_rows(csv_text: str) -> list[dict[str, str]]:
-    reader = csv.DictReader(io.StringIO(csv_text))
-    rows: list[dict[str, str]] = []
+@lru_cache(maxsize=64)
+def _daily_url(symbol: str) -> str:
+    return STOOQ_DAILY_URL.format(symbol=quote(symbol))
 
-    for raw_row in reader:
-        row: dict[str, str] = {}
-        for key, value in raw_row.items():
-            normalized_key = (key or "").lstrip("\ufeff")
-            row[normalized_key] = (value or "").strip()
 
-        if not row.get("Date"):
+def _parse_quote_row(reader: Iterable[list[str]]) -> list[str] | None:
+    header_seen = False
+    for row in reader:
+        cleaned = [cell.strip() for cell in row]
+        if not any(cleaned):
+            continue
+        if not header_seen and cleaned[0].lower() == "symbol":
+            header_seen = True
+            continue
+        return cleaned
+    return None
+
+
+def _parse_daily_closes(reader: Iterable[list[str]]) -> list[tuple[str, float]]:
+    # History only ever plots the close, so keep (date, close) pairs parsed once
+    # here instead of a dict of every column that callers re-parse.
+    closes: list[tuple[str, float]] = []
+    iterator = iter(reader)
+    header = next(iterator, None)
+    if header is None:
+        return closes
+    fieldnames = [key.lstrip("\ufeff") for key in header]
+    if "Date" not in fieldnames or "Close" not in fieldnames:
+        return closes
+    date_index = fieldnames.index("Date")
+    close_index = fieldnames.index("Close")
+    min_width = max(date_index, close_index) + 1
+
+    for raw_row in iterator:
+        if len(raw_row) < min_width:
             continue
-        if parse_float(row.get("Close")) is None:
+        day = raw_row[date_index].strip()
+        if not day:
             continue
-        rows.append(row)
+        # Plain decimals are the norm; only fall back to the lenient parser for
+        # thousands separators and N/D placeholders.
+        try:
+            close_price = float(raw_row[close_index])
+        except ValueError:
+            close_price = parse_float(raw_row[close_index])
+            if close_price is None:
+                continue
+        closes.append((day, close_price))
 
-    return rows
+    return closes
 
 
 def _compute_change_pct(price: float, open_price: float | None) -> float | None:
@@ -0,0 +1,102 @@
+"""Optional Redis-backed cache shared across API worker processes."""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections.abc import Sequence
+from uuid import uuid4
+
+LOGGER = logging.getLogger(__name__)
+
+# Compare-and-delete in one round trip, so a lock that expired and was taken by
+# another worker between a GET and a DEL is never released by the old owner.
+RELEASE_LOCK_SCRIPT = (
+    "if redis.call('get', KEYS[1]) == ARGV[1] then "
+    "return redis.call('del', KEYS[1]) "
+    "end "
+    "return 0"
+)
+
+
+class SharedCache:
+    """Thin wrapper around Redis that degrades to a no-op when not configured.
+
+    Enabled by setting ``REDIS_URL`` and installing the ``redis`` package. When
+    disabled, reads miss and locks are always granted, so callers fall back to
+    their in-process caches unchanged.
+    """
+
+    def __init__(self, url: str | None = None) -> None:
+        self.url = (url if url is not None else os.getenv("REDIS_URL", "")).strip()
+        self._client = None
+        self._errors: tuple[type[BaseException], ...] = ()
+        self._lock_token = uuid4().hex.encode("ascii")
+
+        if not self.url:
+            return
+        try:
+            import redis
+        except ImportError:
+            LOGGER.warning("REDIS_URL is set but the redis package is not installed.")
+            return
+
+        self._client = redis.Redis.from_url(
+            self.url,
+            socket_timeout=1.0,
+            socket_connect_timeout=1.0,
+        )
+        self._errors = (redis.RedisError,)
+
+    @property
+    def enabled(self) -> bool:
+        return self._client is not None
+
+    def get(self, key: str) -> bytes | None:
+        if self._client is None:
+            return None
+        try:
+            return self._client.get(key)
+        except self._errors as exc:
+            LOGGER.warning("Shared cache read failed for '%s': %s", key, exc)
+            return None
+
+    def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        if self._client is None or not keys:
+            return [None] * len(keys)
+        try:
+            return list(self._client.mget(keys))
+        except self._errors as exc:
+            LOGGER.warning("Shared cache read failed for %d keys: %s", len(keys), exc)
+            return [None] * len(keys)
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        if self._client is None:
+            return
+        try:
+            self._client.set(key, value, px=max(1, int(ttl_seconds * 1000)))
+        except self._errors as exc:
+            LOGGER.warning("Shared cache write failed for '%s': %s", key, exc)
+
+    def acquire_lock(self, key: str, ttl_seconds: float) -> bool:
+        if self._client is None:
+            return True
+        try:
+            acquired = self._client.set(
+                key,
+                self._lock_token,
+                nx=True,
+                px=max(1, int(ttl_seconds * 1000)),
+            )
+            return bool(acquired)
+        except self._errors as exc:
+            LOGGER.warning("Shared cache lock failed for '%s': %s", key, exc)
+            return True
+
+    def release_lock(self, key: str) -> None:
+        if self._client is None:
+            return
+        try:
+            self._client.eval(RELEASE_LOCK_SCRIPT, 1, key, self._lock_token)
+        except self._errors as exc:
+            LOGGER.warning("Shared cache unlock failed for '%s': %s", key, exc)
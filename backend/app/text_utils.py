@@ -0,0 +1,31 @@
+"""Text normalization and fingerprinting shared by the news and video services."""
+
+from __future__ import annotations
+
+import hashlib
+
+# Byte table that lowercases ASCII letters, keeps digits, and turns everything else
+# (punctuation, whitespace, the "?" left by non-ASCII characters) into a space.
+_ALNUM_BYTES = b"abcdefghijklmnopqrstuvwxyz0123456789"
+_NORMALIZE_TABLE = bytes(
+    byte + 32 if 65 <= byte <= 90 else byte if byte in _ALNUM_BYTES else 32
+    for byte in range(256)
+)
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase ``text`` and collapse every run of non-``[a-z0-9]`` into one space."""
+    # str.lower() only needs to run for non-ASCII input, where Unicode case folding can
+    # still produce ASCII letters (e.g. the Kelvin sign).
+    if text.isascii():
+        raw = text.encode("ascii")
+    else:
+        raw = text.lower().encode("ascii", "replace")
+    return b" ".join(raw.translate(_NORMALIZE_TABLE).split()).decode("ascii")
+
+
+def title_fingerprint(normalized_title: str) -> int:
+    """Return a stable signed 64-bit dedup key for an already normalized title."""
+    # Dedup only needs a stable 64-bit fingerprint, not a SHA-256 hex string.
+    digest = hashlib.blake2b(normalized_title.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
@@ -2,28 +2,42 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
-import json
+import io
 import logging
 import os
 import re
 import threading
 import time
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from typing import Any
 from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
+from urllib.parse import quote, urlencode
+
+import orjson
+
+from app.http_pool import fetch_bytes
+from app.providers.common import ISO_UTC_FORMAT
+from app.text_utils import normalize_text, title_fingerprint
 
 LOGGER = logging.getLogger(__name__)
 USER_AGENT = "WorldMonitor/0.6 (+http://localhost)"
 YOUTUBE_SEARCH_URL = "https://www.googleapis.com/youtube/v3/search"
+YOUTUBE_SEARCH_STATIC_PARAMS = urlencode({"part": "snippet", "order": "date", "type": "video"})
+YOUTUBE_THUMBNAIL_SIZES = ("high", "medium", "default")
 
-MULTISPACE_RE = re.compile(r"\s+")
-NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+ENTRY_TAGS = frozenset({"item", "entry"})
+TITLE_TAGS = frozenset({"title"})
+SUMMARY_TAGS = frozenset({"description", "summary", "content", "encoded"})
+PUBLISHED_TAGS = frozenset({"pubdate", "published", "updated", "date"})
+LINK_FALLBACK_TAGS = frozenset({"guid", "id"})
 
 
 @dataclass(frozen=True)
@@ -167,28 +181,80 @@ class VideoService:
         self.request_timeout_seconds = max(
             3.0, float(os.getenv("VIDEO_FETCH_TIMEOUT_SECONDS", "10"))
         )
-        self.request_delay_seconds = max(
-            0.0, float(os.getenv("VIDEO_FETCH_DELAY_SECONDS", "0.2"))
-        )
+        self.fetch_concurrency = max(1, int(os.getenv("VIDEO_FETCH_CONCURRENCY", "4")))
         self.max_items_per_source = max(
             4, int(os.getenv("VIDEO_MAX_ITEMS_PER_SOURCE", "10"))
         )
         self.max_items = max(20, int(os.getenv("VIDEO_MAX_ITEMS", "80")))
         self.youtube_api_key = os.getenv("YOUTUBE_API_KEY", "").strip()
+        # Only channelId varies per request, so the rest of the search URL is built once.
+        self._youtube_search_prefix = "{}?{}&{}&channelId=".format(
+            YOUTUBE_SEARCH_URL,
+            YOUTUBE_SEARCH_STATIC_PARAMS,
+            urlencode(
+                {
+                    "maxResults": min(self.max_items_per_source, 10),
+                    "key": self.youtube_api_key,
+                }
+            ),
+        )
 
         self._state_lock = threading.Lock()
         self._refresh_lock = threading.Lock()
-        self._cache: list[dict[str, Any]] = []
+        self._cache: tuple[dict[str, Any], ...] = ()
+        self._cache_json = b"[]"
         self._cached_at = 0.0
+        self._last_refresh_attempt = 0.0
+        self._scheduler_task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        self.refresh_async(force=True)
+        if self._scheduler_task is None:
+            self._scheduler_task = asyncio.create_task(self._scheduler_loop())
+
+    async def stop(self) -> None:
+        if self._scheduler_task is None:
+            return
+        self._scheduler_task.cancel()
+        try:
+            await self._scheduler_task
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._scheduler_task = None
 
     def get_videos(self, force_refresh: bool = False) -> list[dict[str, Any]]:
+        self._trigger_refresh(force_refresh)
+        with self._state_lock:
+            return list(self._cache)
+
+    def get_videos_json(self, force_refresh: bool = False) -> bytes:
+        self._trigger_refresh(force_refresh)
+        with self._state_lock:
+            return self._cache_json
+
+    def _trigger_refresh(self, force_refresh: bool) -> None:
         if force_refresh:
             self.refresh_async(force=True)
-        else:
+        elif self._scheduler_task is None:
+            # Only without the background scheduler (e.g. outside the app lifespan)
+            # does the request path need to notice staleness itself.
             self._refresh_if_stale()
 
-        with self._state_lock:
-            return [dict(item) for item in self._cache]
+    async def _scheduler_loop(self) -> None:
+        while True:
+            # _cached_at is stamped when a fetch finishes, after the attempt started;
+            # refresh() skips until then, so schedule from whichever is later.
+            with self._state_lock:
+                next_due = max(self._last_refresh_attempt, self._cached_at) + self.cache_seconds
+            delay = next_due - time.time()
+            if delay <= 0:
+                await asyncio.to_thread(self.refresh, False)
+                delay = 0.0
+            # Re-check after waking, since a forced refresh may have moved the deadline.
+            # The floor also keeps a refresh that was skipped (e.g. another one still in
+            # flight) from being retried in a tight loop.
+            await asyncio.sleep(max(1.0, delay))
 
     def refresh_async(self, force: bool = False) -> None:
         if self._refresh_lock.locked():
@@ -214,19 +280,24 @@ class VideoService:
         try:
             now = time.time()
             with self._state_lock:
+                self._last_refresh_attempt = now
                 cache_valid = now - self._cached_at < self.cache_seconds
                 if cache_valid and not force:
                     return
 
             items = self._pull_all_sources()
             if items:
+                # Items are never mutated once published, so the snapshot and its
+                # serialized form are shared by every reader until the next refresh.
+                snapshot = tuple(items[: self.max_items])
+                body = orjson.dumps(snapshot)
                 with self._state_lock:
-                    self._cache = items[: self.max_items]
+                    self._cache = snapshot
+                    self._cache_json = body
                     self._cached_at = time.time()
             else:
                 with self._state_lock:
                     if not self._cache:
-                        self._cache = []
                         self._cached_at = time.time()
         except Exception:
             LOGGER.exception("Video refresh failed. Serving cached results.")
@@ -243,40 +314,38 @@ class VideoService:
 
     def _pull_all_sources(self) -> list[dict[str, Any]]:
         seen_urls: set[str] = set()
-        seen_title_hashes: set[str] = set()
+        seen_title_hashes: set[int] = set()
         collected: list[dict[str, Any]] = []
 
-        for source in VIDEO_SOURCES:
-            items = self._safe_fetch_source(source)
-            for item in items[: self.max_items_per_source]:
-                url_key = str(item.get("url", "")).strip().lower()
-                title_hash = str(item.get("_title_hash", "")).strip()
-                if url_key and url_key in seen_urls:
-                    continue
-                if title_hash and title_hash in seen_title_hashes:
-                    continue
-                if url_key:
-                    seen_urls.add(url_key)
-                if title_hash:
+        # Fetch feeds concurrently but consume them in declared order so
+        # deduplication keeps the same winner as a serial pass.
+        workers = min(self.fetch_concurrency, len(VIDEO_SOURCES))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for items in executor.map(self._safe_fetch_source, VIDEO_SOURCES):
+                for item in items[: self.max_items_per_source]:
+                    url_key = str(item.get("url", "")).strip().lower()
+                    title_hash = item["_title_hash"]
+                    if url_key and url_key in seen_urls:
+                        continue
+                    if title_hash in seen_title_hashes:
+                        continue
+                    if url_key:
+                        seen_urls.add(url_key)
                     seen_title_hashes.add(title_hash)
-                collected.append(item)
-
-            if self.request_delay_seconds > 0:
-                time.sleep(self.request_delay_seconds)
+                    collected.append(item)
 
         if self.youtube_api_key:
             api_items = self._fetch_optional_youtube_api()
             for item in api_items:
                 url_key = str(item.get("url", "")).strip().lower()
-                title_hash = str(item.get("_title_hash", "")).strip()
+                title_hash = item["_title_hash"]
                 if url_key and url_key in seen_urls:
                     continue
-                if title_hash and title_hash in seen_title_hashes:
+                if title_hash in seen_title_hashes:
                     continue
                 if url_key:
                     seen_urls.add(url_key)
-                if title_hash:
-                    seen_title_hashes.add(title_hash)
+                seen_title_hashes.add(title_hash)
                 collected.append(item)
 
         collected.sort(key=lambda entry: float(entry.get("_published_epoch", 0.0)), reverse=True)
@@ -310,72 +379,48 @@ class VideoService:
         return []
 
     def _parse_feed(self, xml_bytes: bytes, source: VideoSource) -> list[dict[str, Any]]:
-        root = ET.fromstring(xml_bytes)
         parsed: list[dict[str, Any]] = []
 
-        for node in root.iter():
-            local = _local_name(node.tag)
-            if local not in {"item", "entry"}:
-                continue
-
-            title = _first_child_text(node, {"title"})
-            link = _extract_link(node)
-            if not title or not link:
+        # Stream entries and stop once a source's quota is filled; only that many
+        # are kept per source anyway.
+        for _, node in ET.iterparse(io.BytesIO(xml_bytes), events=("end",)):
+            if _local_name(node.tag) not in ENTRY_TAGS:
                 continue
 
-            if source.video_only and not _looks_like_video_link(link, title):
+            item = _parse_entry(node, source)
+            node.clear()
+            if item is None:
                 continue
-
-            description = _first_child_text(node, {"description", "summary", "content", "encoded"})
-            published_raw = _first_child_text(node, {"pubdate", "published", "updated", "date"})
-            published_dt = _parse_datetime(published_raw)
-
-            parsed.append(
-                {
-                    "id": _stable_id(source.name, link, title, published_dt.timestamp()),
-                    "title": title.strip(),
-                    "source": source.name,
-                    "url": link.strip(),
-                    "published_at": _utc_iso(published_dt),
-                    "topic": _classify_topic(f"{title} {description}"),
-                    "thumbnail": _extract_thumbnail(node),
-                    "provider": source.source_kind,
-                    "description": description.strip(),
-                    "_published_epoch": published_dt.timestamp(),
-                    "_title_hash": _title_hash(title),
-                }
-            )
+            parsed.append(item)
+            if len(parsed) >= self.max_items_per_source:
+                break
 
         return parsed
 
     def _fetch_optional_youtube_api(self) -> list[dict[str, Any]]:
         items: list[dict[str, Any]] = []
 
-        for source_name, channel_id in YOUTUBE_API_CHANNELS:
-            try:
-                items.extend(self._fetch_youtube_api_channel(source_name, channel_id))
-            except (HTTPError, URLError, TimeoutError, ValueError) as exc:
-                LOGGER.warning("YouTube API source failed '%s': %s", source_name, exc)
-            except Exception as exc:
-                LOGGER.warning("Unexpected YouTube API failure '%s': %s", source_name, exc)
-
-            if self.request_delay_seconds > 0:
-                time.sleep(self.request_delay_seconds)
+        workers = min(self.fetch_concurrency, len(YOUTUBE_API_CHANNELS))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for channel_items in executor.map(
+                self._safe_fetch_youtube_api_channel, YOUTUBE_API_CHANNELS
+            ):
+                items.extend(channel_items)
 
         return items
 
+    def _safe_fetch_youtube_api_channel(self, channel: tuple[str, str]) -> list[dict[str, Any]]:
+        source_name, channel_id = channel
+        try:
+            return self._fetch_youtube_api_channel(source_name, channel_id)
+        except (HTTPError, URLError, TimeoutError, ValueError) as exc:
+            LOGGER.warning("YouTube API source failed '%s': %s", source_name, exc)
+        except Exception as exc:
+            LOGGER.warning("Unexpected YouTube API failure '%s': %s", source_name, exc)
+        return []
+
     def _fetch_youtube_api_channel(self, source_name: str, channel_id: str) -> list[dict[str, Any]]:
-        params = urlencode(
-            {
-                "part": "snippet",
-                "channelId": channel_id,
-                "maxResults": min(self.max_items_per_source, 10),
-                "order": "date",
-                "type": "video",
-                "key": self.youtube_api_key,
-            }
-        )
-        url = f"{YOUTUBE_SEARCH_URL}?{params}"
+        url = self._youtube_search_prefix + quote(channel_id, safe="")
         payload = self._download_json(url)
 
         if not isinstance(payload, dict):
@@ -401,11 +446,12 @@ class VideoService:
 
             description = str(snippet.get("description", "")).strip()
             published_dt = _parse_datetime(str(snippet.get("publishedAt", "")).strip())
+            published_epoch = published_dt.timestamp()
             video_url = f"https://www.youtube.com/watch?v={video_id}"
 
             output.append(
                 {
-                    "id": _stable_id(source_name, video_url, title, published_dt.timestamp()),
+                    "id": _stable_id(source_name, video_url, title, published_epoch),
                     "title": title,
                     "source": source_name,
                     "url": video_url,
@@ -414,7 +460,7 @@ class VideoService:
                     "thumbnail": _pick_youtube_thumbnail(snippet.get("thumbnails")),
                     "provider": "youtube_api",
                     "description": description,
-                    "_published_epoch": published_dt.timestamp(),
+                    "_published_epoch": published_epoch,
                     "_title_hash": _title_hash(title),
                 }
             )
@@ -422,97 +468,123 @@ class VideoService:
         return output
 
     def _download_bytes(self, url: str) -> bytes:
-        request = Request(
+        return fetch_bytes(
             url,
             headers={
                 "User-Agent": USER_AGENT,
                 "Accept": "application/rss+xml, application/atom+xml, text/xml;q=0.9, */*;q=0.8",
-                "Accept-Encoding": "identity",
             },
+            timeout_seconds=self.request_timeout_seconds,
         )
 
-        with urlopen(request, timeout=self.request_timeout_seconds) as response:
-            return response.read()
-
     def _download_json(self, url: str) -> object:
-        request = Request(
+        body = fetch_bytes(
             url,
-            headers={
-                "User-Agent": USER_AGENT,
-                "Accept": "application/json",
-            },
+            headers={"User-Agent": USER_AGENT, "Accept": "application/json"},
+            timeout_seconds=self.request_timeout_seconds,
         )
+        return orjson.loads(body)
+
+
+def _parse_entry(node: ET.Element, source: VideoSource) -> dict[str, Any] | None:
+    # One walk over the entry's children collects every text field and the link,
+    # keeping the first non-empty value per field as the separate lookups did.
+    title = ""
+    description = ""
+    published_raw = ""
+    link: str | None = None
+    fallback_link = ""
+    for child in node:
+        local = _local_name(child.tag)
+        if local == "link":
+            if link is not None:
+                continue
+            href = child.attrib.get("href")
+            rel = (child.attrib.get("rel") or "").strip().lower()
+            if href and rel in {"", "alternate"}:
+                link = href.strip()
+                continue
+            text_link = " ".join(child.itertext()).strip()
+            if text_link:
+                link = text_link
+        elif local in LINK_FALLBACK_TAGS:
+            if fallback_link:
+                continue
+            candidate = " ".join(child.itertext()).strip()
+            if candidate.startswith("http://") or candidate.startswith("https://"):
+                fallback_link = candidate
+        elif local in TITLE_TAGS:
+            if not title:
+                title = _child_text(child)
+        elif local in SUMMARY_TAGS:
+            if not description:
+                description = _child_text(child)
+        elif local in PUBLISHED_TAGS:
+            if not published_raw:
+                published_raw = _child_text(child)
+
+    if link is None:
+        link = fallback_link
+    if not title or not link:
+        return None
 
-        with urlopen(request, timeout=self.request_timeout_seconds) as response:
-            raw = response.read().decode("utf-8", errors="replace")
-        return json.loads(raw)
-
+    if source.video_only and not _looks_like_video_link(link, title):
+        return None
 
+    published_dt = _parse_datetime(published_raw)
+    published_epoch = published_dt.timestamp()
+
+    return {
+        "id": _stable_id(source.name, link, title, published_epoch),
+        "title": title.strip(),
+        "source": source.name,
+        "url": link.strip(),
+        "published_at": _utc_iso(published_dt),
+        "topic": _classify_topic(f"{title} {description}"),
+        "thumbnail": _extract_thumbnail(node),
+        "provider": source.source_kind,
+        "description": description.strip(),
+        "_published_epoch": published_epoch,
+        "_title_hash": _title_hash(title),
+    }
+
+
+@lru_cache(maxsize=256)
 def _local_name(tag: str) -> str:
     return tag.rsplit("}", 1)[-1].lower()
 
 
-def _first_child_text(node: ET.Element, local_names: set[str]) -> str:
-    targets = {name.lower() for name in local_names}
-    for child in list(node):
-        if _local_name(child.tag) not in targets:
-            continue
-        text_value = " ".join(child.itertext()).strip()
-        if text_value:
-            return _strip_html(text_value)
-    return ""
-
-
-def _extract_link(node: ET.Element) -> str:
-    for child in list(node):
-        if _local_name(child.tag) != "link":
-            continue
-
-        href = child.attrib.get("href")
-        rel = (child.attrib.get("rel") or "").strip().lower()
-        if href and rel in {"", "alternate"}:
-            return href.strip()
-
-        text_link = " ".join(child.itertext()).strip()
-        if text_link:
-            return text_link
-
-    for child in list(node):
-        if _local_name(child.tag) not in {"guid", "id"}:
-            continue
-        candidate = " ".join(child.itertext()).strip()
-        if candidate.startswith("http://") or candidate.startswith("https://"):
-            return candidate
-
-    return ""
+def _child_text(child: ET.Element) -> str:
+    text_value = " ".join(child.itertext()).strip()
+    return _strip_html(text_value) if text_value else ""
 
 
 def _extract_thumbnail(node: ET.Element) -> str | None:
+    # Prefer any media:thumbnail; otherwise fall back to the first image content,
+    # both found in a single walk of the entry's descendants.
+    image_fallback: str | None = None
     for child in node.iter():
-        if _local_name(child.tag) != "thumbnail":
-            continue
-        url = (child.attrib.get("url") or "").strip()
-        if url:
-            return url
-
-    for child in node.iter():
-        if _local_name(child.tag) != "content":
-            continue
-        medium = (child.attrib.get("medium") or "").strip().lower()
-        if medium != "image":
-            continue
-        url = (child.attrib.get("url") or "").strip()
-        if url:
-            return url
+        local = _local_name(child.tag)
+        if local == "thumbnail":
+            url = (child.attrib.get("url") or "").strip()
+            if url:
+                return url
+        elif local == "content" and image_fallback is None:
+            medium = (child.attrib.get("medium") or "").strip().lower()
+            if medium != "image":
+                continue
+            url = (child.attrib.get("url") or "").strip()
+            if url:
+                image_fallback = url
 
-    return None
+    return image_fallback
 
 
 def _pick_youtube_thumbnail(raw_thumbnails: Any) -> str | None:
     if not isinstance(raw_thumbnails, dict):
         return None
 
-    for key in ("high", "medium", "default"):
+    for key in YOUTUBE_THUMBNAIL_SIZES:
         candidate = raw_thumbnails.get(key)
         if not isinstance(candidate, dict):
             continue
@@ -535,14 +607,34 @@ def _looks_like_video_link(url: str, title: str) -> bool:
 
 
 def _strip_html(text: str) -> str:
-    cleaned = re.sub(r"<[^>]+>", " ", text)
-    return MULTISPACE_RE.sub(" ", cleaned).strip()
+    # Titles and many descriptions carry no markup; skip the tag regex for those and
+    # collapse whitespace with split/join rather than a second regex pass.
+    if "<" in text:
+        text = HTML_TAG_RE.sub(" ", text)
+    return " ".join(text.split())
 
 
 def _parse_datetime(value: str) -> datetime:
-    text = value.strip()
+    parsed = _parse_datetime_cached(value.strip()) if value else None
+    return parsed or datetime.now(timezone.utc)
+
+
+# YouTube feeds and the Data API both use ISO-8601, so try that first and keep the
+# RFC 2822 cascade for plain RSS. Misses are cached as None and fall back to now.
+@lru_cache(maxsize=2048)
+def _parse_datetime_cached(text: str) -> datetime | None:
     if not text:
-        return datetime.now(timezone.utc)
+        return None
+
+    if text[4:5] == "-":
+        try:
+            parsed = datetime.fromisoformat(text)
+        except ValueError:
+            pass
+        else:
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            return parsed.astimezone(timezone.utc)
 
     try:
         parsed = parsedate_to_datetime(text)
@@ -561,36 +653,61 @@ def _parse_datetime(value: str) -> datetime:
         except Exception:
             continue
 
-    return datetime.now(timezone.utc)
+    return None
 
 
 def _utc_iso(value: datetime) -> str:
-    return value.astimezone(timezone.utc).replace(microsecond=0).isoformat().replace(
-        "+00:00", "Z"
-    )
+    return value.astimezone(timezone.utc).strftime(ISO_UTC_FORMAT)
 
 
-def _title_hash(title: str) -> str:
-    normalized = _normalize_text(title)
-    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+# Feeds mostly repeat the same videos between refreshes, so keep the per-title
+# and per-text derived values around instead of recomputing them each time.
+@lru_cache(maxsize=1024)
+def _title_hash(title: str) -> int:
+    return title_fingerprint(normalize_text(title))
 
 
+@lru_cache(maxsize=1024)
 def _stable_id(source: str, url: str, title: str, published_epoch: float) -> str:
+    # An 8-byte blake2b digest gives the same 16 hex characters without hashing a
+    # full SHA-1 and slicing it.
     raw = f"{source}|{url}|{title}|{published_epoch:.0f}".encode("utf-8")
-    return hashlib.sha1(raw).hexdigest()[:16]
-
-
-def _normalize_text(text: str) -> str:
-    lowered = text.lower()
-    alnum = NON_ALNUM_RE.sub(" ", lowered)
-    return MULTISPACE_RE.sub(" ", alnum).strip()
+    return hashlib.blake2b(raw, digest_size=8).hexdigest()
 
 
+@lru_cache(maxsize=1024)
 def _classify_topic(text: str) -> str:
-    normalized = f" {_normalize_text(text)} "
-    for topic, keywords in TOPIC_RULES:
+    # One pass over the tokens finds the earliest-declared topic with a whole-word
+    # keyword hit, instead of probing every keyword against the text.
+    tokens = normalize_text(text).split()
+    best: int | None = None
+    for position, token in enumerate(tokens):
+        candidates = TOPIC_INDEX.get(token)
+        if not candidates:
+            continue
+        for keyword_tokens, rank in candidates:
+            if best is not None and rank >= best:
+                continue
+            if len(keyword_tokens) == 1 or tuple(
+                tokens[position : position + len(keyword_tokens)]
+            ) == keyword_tokens:
+                best = rank
+        if best == 0:
+            break
+    return TOPIC_RULES[best][0] if best is not None else "Geopolitics"
+
+
+def _build_topic_index() -> dict[str, list[tuple[tuple[str, ...], int]]]:
+    """Map each topic keyword's first token to its (tokens, topic rank) entries."""
+    index: dict[str, list[tuple[tuple[str, ...], int]]] = {}
+    for rank, (_, keywords) in enumerate(TOPIC_RULES):
         for keyword in keywords:
-            term = _normalize_text(keyword)
-            if term and f" {term} " in normalized:
-                return topic
-    return "Geopolitics"
+            term = normalize_text(keyword)
+            if term:
+                tokens = tuple(term.split(" "))
+                index.setdefault(tokens[0], []).append((tokens, rank))
+    return index
+
+
+# Keyword normalization happens once here, at import.
+TOPIC_INDEX = _build_topic_index()
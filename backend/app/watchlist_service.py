@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import json
+import os
 import threading
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 WATCHLIST_TOPICS: tuple[str, ...] = (
     "Politics",
     "Geopolitics",
@@ -17,6 +20,8 @@ WATCHLIST_TOPICS: tuple[str, ...] = (
     "Infrastructure",
 )
 
+_TOPIC_LOOKUP: dict[str, str] = {topic.casefold(): topic for topic in WATCHLIST_TOPICS}
+
 DEFAULT_WATCHLIST: dict[str, list[str]] = {
     "countries": [],
     "topics": [],
@@ -49,7 +54,7 @@ class WatchlistService:
             return default_value
 
         try:
-            payload = json.loads(self.storage_path.read_text(encoding="utf-8"))
+            payload = orjson.loads(self.storage_path.read_bytes())
             return _sanitize_watchlist(payload)
         except Exception:
             fallback = _copy_watchlist(DEFAULT_WATCHLIST)
@@ -76,49 +81,41 @@ def _sanitize_string_list(values: Any, *, lowercase: bool) -> list[str]:
     if not isinstance(values, list):
         return []
 
-    output: list[str] = []
-    seen: set[str] = set()
+    # Insertion-ordered dict as an ordered set keyed case-insensitively; the first
+    # spelling of each entry wins.
+    unique: dict[str, str] = {}
     for value in values:
         text = str(value).strip()
-        if not text:
-            continue
-        normalized = text.casefold()
-        if normalized in seen:
-            continue
-        seen.add(normalized)
-        output.append(text.lower() if lowercase else text)
-    return output
+        if text:
+            unique.setdefault(text.casefold(), text.lower() if lowercase else text)
+    return list(unique.values())
 
 
 def _sanitize_topics(values: Any) -> list[str]:
     if not isinstance(values, list):
         return []
 
-    allowed = {topic.casefold(): topic for topic in WATCHLIST_TOPICS}
-    output: list[str] = []
-    seen: set[str] = set()
-
-    for value in values:
-        key = str(value).strip().casefold()
-        if not key:
-            continue
-        canonical = allowed.get(key)
-        if canonical is None or canonical in seen:
-            continue
-        seen.add(canonical)
-        output.append(canonical)
-    return output
+    canonical = (_TOPIC_LOOKUP.get(str(value).strip().casefold()) for value in values)
+    return list(dict.fromkeys(topic for topic in canonical if topic is not None))
 
 
 def _write_watchlist_file(path: Path, payload: dict[str, list[str]]) -> None:
     temp_path = path.with_suffix(path.suffix + ".tmp")
-    temp_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    data = (json.dumps(payload, indent=2) + "\n").encode("utf-8")
+    # Flush the temp file to disk before the rename so a crash can never leave a
+    # truncated watchlist in place of the previous one.
+    with open(temp_path, "wb") as handle:
+        handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
     temp_path.replace(path)
 
 
 def _copy_watchlist(payload: dict[str, list[str]]) -> dict[str, list[str]]:
+    # Stored watchlists are already sanitized to lists of strings, so a shallow copy
+    # of each list is enough to keep callers from mutating shared state.
     return {
-        "countries": [str(item) for item in payload.get("countries", [])],
-        "topics": [str(item) for item in payload.get("topics", [])],
-        "keywords": [str(item) for item in payload.get("keywords", [])],
+        "countries": list(payload["countries"]),
+        "topics": list(payload["topics"]),
+        "keywords": list(payload["keywords"]),
     }
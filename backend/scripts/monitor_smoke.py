@@ -4,10 +4,23 @@ from __future__ import annotations
 
 import json
 import os
-from urllib.request import urlopen
+from concurrent.futures import ThreadPoolExecutor
+
+import urllib3
 
 BASE_URL = os.getenv("WORLD_MONITOR_API", "http://localhost:8000").rstrip("/")
 
+ENDPOINTS = {
+    "news": "/news",
+    "alerts": "/alerts?since_hours=24",
+    "brief": "/brief?window=24h",
+    "videos": "/videos",
+}
+
+# Keep-alive pool sized for one connection per endpoint so the concurrent
+# requests below reuse their sockets instead of reconnecting.
+HTTP_POOL = urllib3.PoolManager(maxsize=len(ENDPOINTS))
+
 
 class SmokeFailure(Exception):
     pass
@@ -15,9 +28,16 @@ class SmokeFailure(Exception):
 
 def fetch_json(path: str) -> object:
     url = f"{BASE_URL}{path}"
-    with urlopen(url, timeout=20) as response:
-        raw = response.read()
-    return json.loads(raw)
+    response = HTTP_POOL.request("GET", url, timeout=20.0)
+    if response.status >= 400:
+        raise SmokeFailure(f"{path} returned HTTP {response.status}")
+    return json.loads(response.data)
+
+
+def fetch_all() -> dict[str, object]:
+    with ThreadPoolExecutor(max_workers=len(ENDPOINTS)) as executor:
+        futures = {name: executor.submit(fetch_json, path) for name, path in ENDPOINTS.items()}
+        return {name: future.result() for name, future in futures.items()}
 
 
 def expect(condition: bool, message: str) -> None:
@@ -26,17 +46,19 @@ def expect(condition: bool, message: str) -> None:
 
 
 def main() -> int:
-    news = fetch_json("/news")
+    results = fetch_all()
+
+    news = results["news"]
     expect(isinstance(news, dict), "/news did not return an object")
     news_items = news.get("items") if isinstance(news, dict) else None
     expect(isinstance(news_items, list), "/news.items missing or invalid")
 
-    alerts = fetch_json("/alerts?since_hours=24")
+    alerts = results["alerts"]
     expect(isinstance(alerts, dict), "/alerts did not return an object")
     alert_items = alerts.get("items") if isinstance(alerts, dict) else None
     expect(isinstance(alert_items, list), "/alerts.items missing or invalid")
 
-    brief = fetch_json("/brief?window=24h")
+    brief = results["brief"]
     expect(isinstance(brief, dict), "/brief did not return an object")
 
     required_brief_keys = {
@@ -50,7 +72,7 @@ def main() -> int:
     missing = sorted(required_brief_keys.difference(brief.keys()))
     expect(not missing, f"/brief missing keys: {', '.join(missing)}")
 
-    videos = fetch_json("/videos")
+    videos = results["videos"]
     expect(isinstance(videos, list), "/videos did not return a list")
 
     print(f"NEWS_ITEMS={len(news_items)}")
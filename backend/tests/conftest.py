@@ -0,0 +1,11 @@
+"""Pytest setup shared by the backend tests."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+# Make the ``app`` package importable once per session, whatever the invocation directory.
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from collections.abc import Sequence
+from unittest import mock
+from urllib.error import URLError
+
+import orjson
+
+from app.providers.coingecko_provider import (
+    COINGECKO_SHARED_KEY,
+    COINGECKO_SHARED_TTL_SECONDS,
+    CoinGeckoProvider,
+)
+from app.providers.common import ProviderQuote
+from app.shared_cache import SharedCache
+
+BITCOIN_PAYLOAD = {"bitcoin": {"usd": 100.0, "usd_24h_change": 1.5, "last_updated_at": 1771500000}}
+
+
+class DictSharedCache(SharedCache):
+    def __init__(self) -> None:
+        super().__init__(url="")
+        self.values: dict[str, bytes] = {}
+
+    def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        return [self.values.get(key) for key in keys]
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self.values[key] = value
+
+
+class CoinGeckoProviderTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.shared_cache = DictSharedCache()
+        self.provider = CoinGeckoProvider(timeout_seconds=2.0, shared_cache=self.shared_cache)
+        self.upstream_calls = 0
+        self.release = threading.Event()
+        self.release.set()
+        self.failure: BaseException | None = None
+
+        def request_payload(coin_ids: list[str]) -> dict[str, object]:
+            self.upstream_calls += 1
+            self.release.wait(timeout=5)
+            if self.failure is not None:
+                raise self.failure
+            return BITCOIN_PAYLOAD
+
+        self.provider._request_payload = request_payload  # type: ignore[method-assign]
+
+    def _fetch_concurrently(self, callers: int) -> tuple[list[ProviderQuote], list[BaseException]]:
+        """Start one owner, wait until its fetch is in flight, then add waiters."""
+        self.release.clear()
+        quotes: list[ProviderQuote] = []
+        errors: list[BaseException] = []
+
+        def call() -> None:
+            try:
+                quotes.append(self.provider.fetch_prices(["bitcoin"])["bitcoin"])
+            except BaseException as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=call)]
+        threads[0].start()
+        deadline = time.monotonic() + 5
+        while "bitcoin" not in self.provider._inflight and time.monotonic() < deadline:
+            time.sleep(0.005)
+        threads.extend(threading.Thread(target=call) for _ in range(callers - 1))
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.1)
+        self.release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+        return quotes, errors
+
+    def test_concurrent_callers_share_one_upstream_fetch(self) -> None:
+        quotes, errors = self._fetch_concurrently(callers=5)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(self.upstream_calls, 1)
+        self.assertEqual([quote.price for quote in quotes], [100.0] * 5)
+        self.assertEqual(self.provider._inflight, {})
+
+    def test_quotes_are_memoized_until_the_ttl_expires(self) -> None:
+        clock = "app.providers.coingecko_provider.time.monotonic"
+        with mock.patch(clock, return_value=1000.0):
+            self.provider.fetch_prices(["bitcoin"])
+        with mock.patch(clock, return_value=1000.0 + COINGECKO_SHARED_TTL_SECONDS - 1):
+            self.provider.fetch_prices(["bitcoin"])
+        self.assertEqual(self.upstream_calls, 1)
+
+        # Past the TTL the local memo is stale; the shared cache must miss too.
+        self.shared_cache.values.clear()
+        with mock.patch(clock, return_value=1000.0 + COINGECKO_SHARED_TTL_SECONDS + 1):
+            quote = self.provider.fetch_prices(["bitcoin"])["bitcoin"]
+        self.assertEqual(self.upstream_calls, 2)
+        self.assertEqual(quote.price, 100.0)
+
+    def test_shared_cache_hits_skip_upstream_and_fetches_populate_it(self) -> None:
+        self.shared_cache.values[COINGECKO_SHARED_KEY.format(coin_id="ethereum")] = orjson.dumps(
+            {"price": 2000.0, "change_pct": -1.0, "as_of": "2026-02-20T10:00:00Z"}
+        )
+
+        quotes = self.provider.fetch_prices(["ethereum", "bitcoin"])
+
+        self.assertEqual(self.upstream_calls, 1)
+        self.assertEqual(quotes["ethereum"].price, 2000.0)
+        self.assertEqual(quotes["bitcoin"].price, 100.0)
+        stored = self.shared_cache.values[COINGECKO_SHARED_KEY.format(coin_id="bitcoin")]
+        self.assertEqual(orjson.loads(stored)["price"], 100.0)
+
+    def test_upstream_error_resolves_waiters_and_is_not_cached(self) -> None:
+        self.failure = URLError("unreachable")
+        quotes, errors = self._fetch_concurrently(callers=3)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(self.upstream_calls, 1)
+        self.assertEqual(len(quotes), 3)
+        for quote in quotes:
+            self.assertIsNone(quote.price)
+            self.assertIn("URLError", quote.error or "")
+
+        self.failure = None
+        self.assertEqual(self.provider.fetch_prices(["bitcoin"])["bitcoin"].price, 100.0)
+        self.assertEqual(self.upstream_calls, 2)
+
+    def test_unexpected_failure_does_not_poison_the_inflight_future(self) -> None:
+        self.failure = RuntimeError("boom")
+        quotes, errors = self._fetch_concurrently(callers=3)
+
+        # The owner re-raises; every waiter gets an error quote instead of hanging.
+        self.assertEqual([type(exc) for exc in errors], [RuntimeError])
+        self.assertEqual(len(quotes), 2)
+        for quote in quotes:
+            self.assertIsNone(quote.price)
+            self.assertIn("RuntimeError", quote.error or "")
+        self.assertEqual(self.provider._inflight, {})
+
+        self.failure = None
+        self.assertEqual(self.provider.fetch_prices(["bitcoin"])["bitcoin"].price, 100.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,31 +1,42 @@
 from __future__ import annotations
 
 import json
-import shutil
-import sys
+import tempfile
 import unittest
-import uuid
 import warnings
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
-from fastapi import FastAPI
-
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
 from app.api import create_ops_router
 from app.connectors.base import ConnectorResult
 from app.data.event_store import EventStore
 from app.domain.models import WorldEvent
 from app.jobs import EventIngestionService
+from app.providers.common import ISO_UTC_FORMAT
 
 warnings.filterwarnings("ignore", category=ResourceWarning, message="unclosed database")
 
+SOURCES_JSON = json.dumps(
+    {
+        "sources": [
+            {
+                "name": "Dummy",
+                "urls": ["https://example.com/feed.xml"],
+                "category": "other",
+            }
+        ]
+    },
+    separators=(",", ":"),
+).encode("utf-8")
+
 
 class FakeConnector:
     name = "Fake Connector"
 
     def fetch(self, *, since_hours: int = 48) -> ConnectorResult:
+        # The store filters on age against the real clock, so stamp a recent time.
+        occurred_at = (datetime.now(timezone.utc) - timedelta(hours=1)).strftime(ISO_UTC_FORMAT)
         event = WorldEvent(
             external_id="fake-1",
             source=self.name,
@@ -42,8 +53,8 @@ class FakeConnector:
             geohash=None,
             severity=50,
             confidence=90,
-            occurred_at="2026-02-20T10:00:00Z",
-            started_at="2026-02-20T10:00:00Z",
+            occurred_at=occurred_at,
+            started_at=occurred_at,
             cluster_id="cluster-test",
             raw={"test": True},
         )
@@ -51,61 +62,53 @@ class FakeConnector:
 
 
 class EventsApiIntegrationTest(unittest.TestCase):
+    tmp: Path
+    store: EventStore
+    ingestion_service: EventIngestionService
+    endpoints: dict[str, Any]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # One store shared by the read-only tests, under the OS temp dir. Class
+        # cleanups also run when setUpClass fails part-way.
+        tmpdir = tempfile.TemporaryDirectory(prefix="events_")
+        cls.addClassCleanup(tmpdir.cleanup)
+        cls.tmp = Path(tmpdir.name)
+
+        sources_path = cls.tmp / "sources.json"
+        sources_path.write_bytes(SOURCES_JSON)
+
+        cls.store = EventStore(db_path=cls.tmp / "world_monitor.db")
+        cls.ingestion_service = EventIngestionService(
+            store=cls.store, rss_config_path=sources_path
+        )
+        cls.ingestion_service.connectors = [FakeConnector()]
+        cls.ingestion_service.ingest(force=True)
+
+        # Handlers are plain callables on the router; no app needs to be built.
+        router = create_ops_router(store=cls.store, ingestion_service=cls.ingestion_service)
+        cls.endpoints = {
+            getattr(route, "path", ""): getattr(route, "endpoint", None)
+            for route in router.routes
+        }
+
     def test_events_endpoint_returns_items(self) -> None:
-        base_tmp = Path(__file__).resolve().parent / ".tmp"
-        base_tmp.mkdir(parents=True, exist_ok=True)
-        tmp = base_tmp / f"events_{uuid.uuid4().hex}"
-        tmp.mkdir(parents=True, exist_ok=True)
-
-        try:
-            db_path = tmp / "world_monitor.db"
-            sources_path = tmp / "sources.json"
-            sources_path.write_text(
-                json.dumps(
-                    {
-                        "sources": [
-                            {
-                                "name": "Dummy",
-                                "urls": ["https://example.com/feed.xml"],
-                                "category": "other",
-                            }
-                        ]
-                    }
-                ),
-                encoding="utf-8",
-            )
-
-            store = EventStore(db_path=db_path)
-            ingestion_service = EventIngestionService(store=store, rss_config_path=sources_path)
-            ingestion_service.connectors = [FakeConnector()]
-            ingestion_service.ingest(force=True)
-
-            app = FastAPI()
-            app.include_router(create_ops_router(store=store, ingestion_service=ingestion_service))
-
-            endpoint = None
-            for route in app.routes:
-                if getattr(route, "path", None) == "/events":
-                    endpoint = route.endpoint
-                    break
-            self.assertIsNotNone(endpoint, "Missing /events endpoint")
-
-            payload: dict[str, Any] = endpoint(  # type: ignore[misc]
-                limit=50,
-                since_hours=24 * 30,
-                category=None,
-                region=None,
-                country=None,
-                q=None,
-                refresh=0,
-            )
-
-            self.assertIn("items", payload)
-            self.assertGreaterEqual(len(payload["items"]), 1)
-            self.assertEqual(payload["items"][0]["title"], "Synthetic event for integration test")
-        finally:
-            shutil.rmtree(tmp, ignore_errors=True)
+        endpoint = self.endpoints.get("/events")
+        self.assertIsNotNone(endpoint, "Missing /events endpoint")
+
+        payload: dict[str, Any] = endpoint(  # type: ignore[misc]
+            limit=50,
+            since_hours=24 * 30,
+            category=None,
+            region=None,
+            country=None,
+            q=None,
+            refresh=0,
+        )
 
+        self.assertIn("items", payload)
+        self.assertGreaterEqual(len(payload["items"]), 1)
+        self.assertEqual(payload["items"][0]["title"], "Synthetic event for integration test")
 
 if __name__ == "__main__":
     unittest.main()
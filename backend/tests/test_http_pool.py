@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import io
+import unittest
+from unittest import mock
+from urllib.error import HTTPError, URLError
+
+import urllib3
+
+from app import http_pool
+
+URL = "https://example.com/feed"
+
+
+def make_response(body: bytes, status: int = 200, preload: bool = True) -> urllib3.HTTPResponse:
+    return urllib3.HTTPResponse(
+        body=io.BytesIO(body),
+        status=status,
+        reason="Not Found" if status == 404 else "OK",
+        preload_content=preload,
+    )
+
+
+class FetchBytesTest(unittest.TestCase):
+    def test_returns_body_and_sends_headers(self) -> None:
+        with mock.patch.object(
+            http_pool.HTTP_POOL, "request", return_value=make_response(b"payload")
+        ) as request:
+            body = http_pool.fetch_bytes(URL, headers={"Accept": "text/xml"}, timeout_seconds=3)
+
+        self.assertEqual(body, b"payload")
+        headers = request.call_args.kwargs["headers"]
+        self.assertEqual(headers["Accept"], "text/xml")
+        self.assertEqual(headers["Accept-Encoding"], http_pool.ACCEPT_ENCODING)
+
+    def test_error_status_raises_http_error(self) -> None:
+        for status in (400, 404, 503):
+            with self.subTest(status=status), mock.patch.object(
+                http_pool.HTTP_POOL, "request", return_value=make_response(b"", status=status)
+            ):
+                with self.assertRaises(HTTPError) as ctx:
+                    http_pool.fetch_bytes(URL, headers={}, timeout_seconds=3)
+                self.assertEqual(ctx.exception.code, status)
+                self.assertEqual(ctx.exception.url, URL)
+
+    def test_success_statuses_below_400_do_not_raise(self) -> None:
+        with mock.patch.object(
+            http_pool.HTTP_POOL, "request", return_value=make_response(b"ok", status=304)
+        ):
+            self.assertEqual(http_pool.fetch_bytes(URL, headers={}, timeout_seconds=3), b"ok")
+
+    def test_urllib3_errors_raise_url_error(self) -> None:
+        failures = (
+            urllib3.exceptions.MaxRetryError(None, URL, reason=None),
+            urllib3.exceptions.ReadTimeoutError(None, URL, "read timed out"),
+            urllib3.exceptions.ProtocolError("connection reset"),
+        )
+        for failure in failures:
+            with self.subTest(failure=type(failure).__name__), mock.patch.object(
+                http_pool.HTTP_POOL, "request", side_effect=failure
+            ):
+                with self.assertRaises(URLError) as ctx:
+                    http_pool.fetch_bytes(URL, headers={}, timeout_seconds=3)
+                self.assertIsNot(type(ctx.exception), HTTPError)
+                self.assertIs(ctx.exception.reason, failure)
+
+
+class IterLinesTest(unittest.TestCase):
+    def test_yields_lines_without_preloading(self) -> None:
+        with mock.patch.object(
+            http_pool.HTTP_POOL,
+            "request",
+            return_value=make_response(b"a,b\r\n1,2\r\n3,4", preload=False),
+        ) as request:
+            lines = list(http_pool.iter_lines(URL, headers={}, timeout_seconds=3))
+
+        self.assertEqual(lines, [b"a,b\r\n", b"1,2\r\n", b"3,4"])
+        self.assertFalse(request.call_args.kwargs["preload_content"])
+
+    def test_request_is_deferred_until_iteration(self) -> None:
+        with mock.patch.object(http_pool.HTTP_POOL, "request") as request:
+            lines = http_pool.iter_lines(URL, headers={}, timeout_seconds=3)
+            request.assert_not_called()
+            lines.close()
+
+    def test_errors_map_like_fetch_bytes(self) -> None:
+        with mock.patch.object(
+            http_pool.HTTP_POOL,
+            "request",
+            return_value=make_response(b"", status=404, preload=False),
+        ):
+            with self.assertRaises(HTTPError):
+                list(http_pool.iter_lines(URL, headers={}, timeout_seconds=3))
+
+        failure = urllib3.exceptions.ProtocolError("connection reset")
+        response = make_response(b"", preload=False)
+        with mock.patch.object(http_pool.HTTP_POOL, "request", return_value=response):
+            with mock.patch.object(response, "stream", side_effect=failure):
+                with self.assertRaises(URLError) as ctx:
+                    list(http_pool.iter_lines(URL, headers={}, timeout_seconds=3))
+        self.assertIs(ctx.exception.reason, failure)
+
+
+if __name__ == "__main__":
+    unittest.main()
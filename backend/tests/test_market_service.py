@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from unittest import mock
+
+import orjson
+
+from app.market_service import SHARED_SNAPSHOT_KEY, MarketService, _encode_shared
+from app.shared_cache import SharedCache
+
+
+class LockedSharedCache(SharedCache):
+    """Shared cache whose refresh lock is always held by another worker."""
+
+    def __init__(self) -> None:
+        super().__init__(url="")
+        self.values: dict[str, bytes] = {}
+        self.calls: list[str] = []
+
+    def get(self, key: str) -> bytes | None:
+        self.calls.append("get")
+        return self.values.get(key)
+
+    def acquire_lock(self, key: str, ttl_seconds: float) -> bool:
+        self.calls.append("acquire_lock")
+        return False
+
+
+class MarketRefreshWaitTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.service = MarketService(shared_cache=SharedCache(url=""))
+        self.service.request_timeout_seconds = 0.2
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+        def refresh_markets(force: bool) -> None:
+            self.started.set()
+            self.release.wait(timeout=10)
+
+        self.service._refresh_markets = refresh_markets  # type: ignore[method-assign]
+
+    def tearDown(self) -> None:
+        self.release.set()
+
+    def test_waiter_gives_up_after_request_timeout_and_serves_stale(self) -> None:
+        owner = threading.Thread(target=self.service.refresh, args=(True,))
+        owner.start()
+        self.assertTrue(self.started.wait(timeout=5))
+        stale = self.service.get_markets_json()
+
+        started_at = time.monotonic()
+        with self.assertLogs("app.market_service", level="WARNING"):
+            self.service.refresh(force=True)
+        elapsed = time.monotonic() - started_at
+
+        self.assertLess(elapsed, 2.0)
+        self.assertGreaterEqual(elapsed, 0.15)
+        self.assertEqual(self.service.get_markets_json(), stale)
+
+        self.release.set()
+        owner.join(timeout=5)
+        self.assertIsNone(self.service._inflight)
+
+    def test_waiter_returns_as_soon_as_the_refresh_finishes(self) -> None:
+        self.service.request_timeout_seconds = 5.0
+        owner = threading.Thread(target=self.service.refresh, args=(True,))
+        owner.start()
+        self.assertTrue(self.started.wait(timeout=5))
+        threading.Timer(0.1, self.release.set).start()
+
+        started_at = time.monotonic()
+        self.service.refresh(force=True)
+
+        self.assertLess(time.monotonic() - started_at, 2.0)
+        owner.join(timeout=5)
+
+
+class MarketSharedLockMissTest(unittest.TestCase):
+    def test_lock_miss_backs_off_reads_until_the_retry_deadline(self) -> None:
+        shared_cache = LockedSharedCache()
+        service = MarketService(shared_cache=shared_cache)
+        clock = "app.market_service.time.time"
+
+        with mock.patch(clock, return_value=1000.0):
+            service.refresh()
+        self.assertEqual(shared_cache.calls, ["get", "acquire_lock"])
+
+        shared_cache.calls.clear()
+        with mock.patch(clock, return_value=1000.0 + service.shared_retry_seconds - 1):
+            with mock.patch.object(service, "refresh_async") as refresh_async:
+                for _ in range(20):
+                    service.get_markets_json()
+        refresh_async.assert_not_called()
+        self.assertEqual(shared_cache.calls, [])
+
+        # Past the deadline one read picks up the lock holder's published snapshot.
+        body = orjson.dumps([{"symbol": "SPX", "price": 1.0}])
+        shared_cache.values[SHARED_SNAPSHOT_KEY] = _encode_shared(1003.0, body)
+        with mock.patch(clock, return_value=1000.0 + service.shared_retry_seconds + 1):
+            with mock.patch.object(service, "refresh_async") as refresh_async:
+                self.assertEqual(service.get_markets_json(), body)
+                service.get_markets_json()
+        refresh_async.assert_not_called()
+        self.assertEqual(shared_cache.calls, ["get"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import unittest
+
+from app.news_service import (
+    NORMALIZED_CATEGORY_RULES,
+    NORMALIZED_COUNTRY_SPECS,
+    _classify_tokens,
+    _match_keywords,
+)
+from app.text_utils import normalize_text
+
+
+def scan_category(text: str) -> int | None:
+    """The per-keyword substring scan the token index replaced."""
+    padded = f" {normalize_text(text)} "
+    for priority, (_, keywords) in enumerate(NORMALIZED_CATEGORY_RULES):
+        if any(f" {keyword} " in padded for keyword in keywords):
+            return priority
+    return None
+
+
+def scan_country(text: str) -> int | None:
+    padded = f" {normalize_text(text)} "
+    for priority, (_, _, keywords) in enumerate(NORMALIZED_COUNTRY_SPECS):
+        if any(f" {keyword} " in padded for keyword in keywords):
+            return priority
+    return None
+
+
+# Each text names at most one country (or nested phrases of one place), where the
+# old scan order and the index's first-mention rule agree.
+KEYWORD_CASES = (
+    "",
+    "War",
+    "Markets rally after ceasefire",
+    "Oil prices climb",
+    "Warsaw hosts a trade fair",
+    "Oilfield workers strike",
+    "Air strike near the border",
+    "An air show, then a strike vote",
+    "Interest rate decision due",
+    "Central bank holds rates; interest rises",
+    "Power grid expansion approved",
+    "Grid expansion and power cuts",
+    "Prime minister visits South Korea",
+    "South African rand slides",
+    "South Africa",
+    "South Sudan",
+    "Saudi Arabia oil output",
+    "Saudi royals meet",
+    "United Arab Emirates",
+    "United front",
+    "New Zealander wins",
+    "New York markets",
+    "Democratic Republic of the Congo election",
+    "Republic of the Congo budget",
+    "Congo Brazzaville",
+    "Sudanese army and RSF",
+    "World Bank lends to Kenya",
+    "Security council meets on Gaza",
+)
+
+
+class KeywordIndexEquivalenceTest(unittest.TestCase):
+    def test_index_matches_substring_scan(self) -> None:
+        for text in KEYWORD_CASES:
+            with self.subTest(text=text):
+                category, country = _match_keywords(normalize_text(text).split())
+                self.assertEqual(category, scan_category(text))
+                self.assertEqual(country, scan_country(text))
+
+
+
+def classify(text: str, source_name: str = "Wire") -> tuple[str, str, str]:
+    return _classify_tokens(normalize_text(text).split(), source_name)
+
+
+class ClassifyTokensTest(unittest.TestCase):
+    def test_multi_token_phrases(self) -> None:
+        cases = (
+            ("Air strike reported overnight", "conflict"),
+            ("Interest rate decision due", "economy"),
+            ("Regional bloc expands", "geopolitics"),
+            # Split across the text, the words are not the phrase.
+            ("Interest in the rate card", "geopolitics"),
+        )
+        for text, category in cases:
+            with self.subTest(text=text):
+                self.assertEqual(classify(text)[0], category)
+
+    def test_category_rule_order_beats_text_position(self) -> None:
+        cases = (
+            # "trade" (economy) comes first in the text, "troops" (conflict) first in the rules.
+            ("Trade talks stall as troops mass", "conflict"),
+            ("Oil market jitters", "energy"),
+            ("Bitcoin budget bill passes parliament", "markets"),
+            # Overlapping phrases: "power grid" (energy) outranks "grid expansion".
+            ("Power grid expansion approved", "energy"),
+        )
+        for text, category in cases:
+            with self.subTest(text=text):
+                self.assertEqual(classify(text)[0], category)
+
+    def test_country_is_the_first_one_mentioned(self) -> None:
+        cases = (
+            # Israel precedes Palestine in COUNTRY_SPECS, but Gaza is named first.
+            ("Gaza aid talks as Israel weighs truce", ("Middle East", "Palestine")),
+            ("Israel weighs truce over Gaza", ("Middle East", "Israel")),
+            ("Kenya and United States sign pact", ("Africa", "Kenya")),
+            # At one position the longest phrase wins over its suffix.
+            (
+                "Democratic Republic of the Congo and Kenya",
+                ("Africa", "Democratic Republic of the Congo"),
+            ),
+            ("Republic of the Congo votes", ("Africa", "Congo")),
+            ("South African rand slides", ("Africa", "South Africa")),
+        )
+        for text, (region, country) in cases:
+            with self.subTest(text=text):
+                self.assertEqual(classify(text)[1:], (region, country))
+
+    def test_fallbacks_without_keyword_hits(self) -> None:
+        self.assertEqual(classify("Quiet day", "IMF Blog"), ("economy", "Global", "Global"))
+        self.assertEqual(classify("Quiet day"), ("geopolitics", "Global", "Global"))
+
+
+if __name__ == "__main__":
+    unittest.main()
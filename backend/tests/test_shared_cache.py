@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import unittest
+from collections.abc import Sequence
+
+from app.shared_cache import RELEASE_LOCK_SCRIPT, SharedCache
+
+
+class FakeRedisError(Exception):
+    pass
+
+
+class FakeRedis:
+    """In-memory stand-in for the subset of redis.Redis that SharedCache uses."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+        self.fail = False
+
+    def _check(self) -> None:
+        if self.fail:
+            raise FakeRedisError("connection refused")
+
+    def get(self, key: str) -> bytes | None:
+        self._check()
+        return self.data.get(key)
+
+    def mget(self, keys: Sequence[str]) -> list[bytes | None]:
+        self._check()
+        return [self.data.get(key) for key in keys]
+
+    def set(self, key: str, value: bytes, px: int, nx: bool = False) -> bool | None:
+        self._check()
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def eval(self, script: str, numkeys: int, *args: object) -> int:
+        self._check()
+        assert script == RELEASE_LOCK_SCRIPT and numkeys == 1
+        key, token = args
+        if self.data.get(str(key)) == token:
+            del self.data[str(key)]
+            return 1
+        return 0
+
+
+def make_cache(client: FakeRedis) -> SharedCache:
+    cache = SharedCache(url="")
+    cache._client = client
+    cache._errors = (FakeRedisError,)
+    return cache
+
+
+class SharedCacheDisabledTest(unittest.TestCase):
+    def test_without_redis_reads_miss_and_locks_are_granted(self) -> None:
+        cache = SharedCache(url="")
+
+        self.assertFalse(cache.enabled)
+        self.assertIsNone(cache.get("k"))
+        self.assertEqual(cache.get_many(["a", "b"]), [None, None])
+        cache.set("k", b"v", ttl_seconds=5)
+        self.assertTrue(cache.acquire_lock("lock", ttl_seconds=5))
+        cache.release_lock("lock")
+
+
+class SharedCacheRedisTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = FakeRedis()
+        self.cache = make_cache(self.client)
+
+    def test_get_many_preserves_key_order(self) -> None:
+        self.cache.set("a", b"1", ttl_seconds=5)
+        self.cache.set("c", b"3", ttl_seconds=5)
+
+        self.assertEqual(self.cache.get_many(["a", "b", "c"]), [b"1", None, b"3"])
+        self.assertEqual(self.cache.get_many([]), [])
+
+    def test_errors_degrade_to_misses_and_granted_locks(self) -> None:
+        self.client.fail = True
+
+        with self.assertLogs("app.shared_cache", level="WARNING"):
+            self.assertIsNone(self.cache.get("k"))
+            self.assertEqual(self.cache.get_many(["a", "b"]), [None, None])
+            self.cache.set("k", b"v", ttl_seconds=5)
+            self.assertTrue(self.cache.acquire_lock("lock", ttl_seconds=5))
+            self.cache.release_lock("lock")
+
+    def test_lock_is_released_only_by_its_owner(self) -> None:
+        other = make_cache(self.client)
+
+        self.assertTrue(self.cache.acquire_lock("lock", ttl_seconds=5))
+        self.assertFalse(other.acquire_lock("lock", ttl_seconds=5))
+
+        other.release_lock("lock")
+        self.assertIn("lock", self.client.data)
+
+        self.cache.release_lock("lock")
+        self.assertNotIn("lock", self.client.data)
+        self.assertTrue(other.acquire_lock("lock", ttl_seconds=5))
+
+    def test_expired_lock_taken_by_another_worker_survives_release(self) -> None:
+        other = make_cache(self.client)
+        self.assertTrue(self.cache.acquire_lock("lock", ttl_seconds=5))
+
+        # The original owner's lock expires and another worker takes it over.
+        del self.client.data["lock"]
+        self.assertTrue(other.acquire_lock("lock", ttl_seconds=5))
+
+        self.cache.release_lock("lock")
+        self.assertEqual(self.client.data.get("lock"), other._lock_token)
+
+
+if __name__ == "__main__":
+    unittest.main()
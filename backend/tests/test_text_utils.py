@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import re
+import unittest
+
+from app.text_utils import normalize_text
+
+
+def regex_normalize(text: str) -> str:
+    """The lower() + [^a-z0-9]+ normalizer the translate table replaced."""
+    return re.sub(r"\s+", " ", re.sub(r"[^a-z0-9]+", " ", text.lower())).strip()
+
+
+NORMALIZE_CASES = (
+    ("", ""),
+    ("   ", ""),
+    ("Hello, World!!", "hello world"),
+    ("  --Kenya's   GDP--  ", "kenya s gdp"),
+    ("tab\tnew\nline\r\n", "tab new line"),
+    ("G20/G7 summit: 2026", "g20 g7 summit 2026"),
+    # Non-ASCII letters drop out, except where Unicode lowercasing yields ASCII.
+    ("Café élysée", "caf lys e"),
+    ("Kelvin", "kelvin"),
+    ("İstanbul", "i stanbul"),
+    ("straße", "stra e"),
+    ("ＡＢＣ 123", "123"),
+    ("٣ days", "days"),
+)
+
+
+class NormalizeTextTest(unittest.TestCase):
+    def test_matches_regex_normalizer(self) -> None:
+        for text, expected in NORMALIZE_CASES:
+            with self.subTest(text=text):
+                self.assertEqual(regex_normalize(text), expected)
+                self.assertEqual(normalize_text(text), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import unittest
+from typing import Any
+
+from app.video_service import VideoService
+
+
+class VideoSchedulerTest(unittest.TestCase):
+    def test_scheduler_refreshes_once_per_interval(self) -> None:
+        service = VideoService()
+        service.cache_seconds = 1
+        calls: list[float] = []
+        original_refresh = service.refresh
+
+        def slow_pull() -> list[dict[str, Any]]:
+            time.sleep(0.2)
+            return [{"id": "v1", "title": "Clip"}]
+
+        def counting_refresh(force: bool = False) -> None:
+            calls.append(time.monotonic())
+            original_refresh(force)
+
+        service._pull_all_sources = slow_pull  # type: ignore[method-assign]
+        service.refresh = counting_refresh  # type: ignore[method-assign]
+
+        # State right after a slow fetch: the attempt deadline has passed but the
+        # cache, stamped when the fetch finished, is still fresh.
+        now = time.time()
+        service._last_refresh_attempt = now - 1.5
+        service._cached_at = now - 0.5
+
+        async def run_scheduler() -> None:
+            task = asyncio.create_task(service._scheduler_loop())
+            await asyncio.sleep(3.5)
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        asyncio.run(run_scheduler())
+
+        # Roughly one refresh per interval; a loop that spins while the cache is
+        # still fresh makes thousands.
+        self.assertGreaterEqual(len(calls), 2)
+        self.assertLessEqual(len(calls), 5)
+        self.assertEqual(service.get_videos()[0]["id"], "v1")
+
+
+if __name__ == "__main__":
+    unittest.main()